@@ -0,0 +1,3 @@
+-- CreateIndex
+CREATE INDEX "LiteLLM_HealthCheckTable_model_name_checked_at_idx" ON "LiteLLM_HealthCheckTable"("model_name", "checked_at" DESC);
+
@@ -12,7 +12,7 @@ import asyncio
 import time
 import traceback
 from concurrent.futures import ThreadPoolExecutor
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union
 
 if TYPE_CHECKING:
     from litellm.types.caching import RedisPipelineIncrementOperation
@@ -319,10 +319,16 @@ class DualCache(BaseCache):
 
     # async_batch_set_cache
     async def async_set_cache_pipeline(
-        self, cache_list: list, local_only: bool = False, **kwargs
+        self,
+        cache_list: list,
+        local_only: bool = False,
+        serializer: Optional[Callable[[Any], Union[str, bytes]]] = None,
+        **kwargs,
     ):
         """
         Batch write values to the cache
+
+        `serializer` is only used for the redis write, defaults to `json.dumps`
         """
         print_verbose(
             f"async batch set cache: cache keys: {cache_list}; local_only: {local_only}"
@@ -335,7 +341,10 @@ class DualCache(BaseCache):
 
             if self.redis_cache is not None and local_only is False:
                 await self.redis_cache.async_set_cache_pipeline(
-                    cache_list=cache_list, ttl=kwargs.pop("ttl", None), **kwargs
+                    cache_list=cache_list,
+                    ttl=kwargs.pop("ttl", None),
+                    serializer=serializer,
+                    **kwargs,
                 )
         except Exception as e:
             verbose_logger.exception(
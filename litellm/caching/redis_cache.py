@@ -14,7 +14,7 @@ import inspect
 import json
 import time
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, Union, cast
 
 import litellm
 from litellm._logging import print_verbose, verbose_logger
@@ -408,18 +408,23 @@ class RedisCache(BaseCache):
         pipe: Union[pipeline, cluster_pipeline],
         cache_list: List[Tuple[Any, Any]],
         ttl: Optional[float],
+        serializer: Optional[Callable[[Any], Union[str, bytes]]] = None,
     ) -> List:
         """
         Helper function for executing a pipeline of set operations on Redis
+
+        `serializer` encodes each value before it is written, defaults to `json.dumps`
         """
         ttl = self.get_ttl(ttl=ttl)
+        if serializer is None:
+            serializer = json.dumps
         # Iterate through each key-value pair in the cache_list and set them in the pipeline.
         for cache_key, cache_value in cache_list:
             cache_key = self.check_and_fix_namespace(key=cache_key)
             print_verbose(
                 f"Set ASYNC Redis Cache PIPELINE: key: {cache_key}\nValue {cache_value}\nttl={ttl}"
             )
-            json_cache_value = json.dumps(cache_value)
+            json_cache_value = serializer(cache_value)
             # Set the value with a TTL if it's provided.
             _td: Optional[timedelta] = None
             if ttl is not None:
@@ -434,7 +439,11 @@ class RedisCache(BaseCache):
         return results
 
     async def async_set_cache_pipeline(
-        self, cache_list: List[Tuple[Any, Any]], ttl: Optional[float] = None, **kwargs
+        self,
+        cache_list: List[Tuple[Any, Any]],
+        ttl: Optional[float] = None,
+        serializer: Optional[Callable[[Any], Union[str, bytes]]] = None,
+        **kwargs,
     ):
         """
         Use Redis Pipelines for bulk write operations
@@ -452,7 +461,9 @@ class RedisCache(BaseCache):
         cache_value: Any = None
         try:
             async with _redis_client.pipeline(transaction=False) as pipe:
-                results = await self._pipeline_helper(pipe, cache_list, ttl)
+                results = await self._pipeline_helper(
+                    pipe, cache_list, ttl, serializer=serializer
+                )
 
             print_verbose(f"pipeline results: {results}")
             # Optionally, you could process 'results' to make sure that all set operations were successful.
@@ -72,6 +72,8 @@ MAX_SIZE_IN_MEMORY_QUEUE = int(os.getenv("MAX_SIZE_IN_MEMORY_QUEUE", 10000))
 MAX_IN_MEMORY_QUEUE_FLUSH_COUNT = int(
     os.getenv("MAX_IN_MEMORY_QUEUE_FLUSH_COUNT", 1000)
 )
+MAX_SIZE_PROXY_HOOK_QUEUE = int(os.getenv("MAX_SIZE_PROXY_HOOK_QUEUE", 1024))
+PROXY_HOOK_QUEUE_NUM_WORKERS = int(os.getenv("PROXY_HOOK_QUEUE_NUM_WORKERS", 4))
 ###############################################################################################
 MINIMUM_PROMPT_CACHE_TOKEN_COUNT = int(
     os.getenv("MINIMUM_PROMPT_CACHE_TOKEN_COUNT", 1024)
@@ -1,4 +1,4 @@
-from typing import Callable, List, Set, Type, Union
+from typing import Callable, Iterable, List, Set, Type, Union
 
 import litellm
 from litellm._logging import verbose_logger
@@ -47,6 +47,38 @@ class LoggingCallbackManager:
             callback=callback, parent_list=litellm.callbacks  # type: ignore
         )
 
+    def add_litellm_callbacks(
+        self, callbacks: Iterable[Union[CustomLogger, str, Callable]]
+    ):
+        """
+        Bulk add callbacks to litellm.callbacks
+
+        Same duplicate checks as `add_litellm_callback`, but the keys of the existing custom loggers are only computed once.
+        """
+        parent_list: List[Union[CustomLogger, Callable, str]] = litellm.callbacks  # type: ignore
+        existing_custom_logger_keys = {
+            self._get_custom_logger_key(existing_logger)
+            for existing_logger in parent_list
+            if isinstance(existing_logger, CustomLogger)
+        }
+        for callback in callbacks:
+            if not isinstance(callback, CustomLogger):
+                self._safe_add_callback_to_list(
+                    callback=callback, parent_list=parent_list
+                )
+                continue
+
+            if not self._check_callback_list_size(parent_list):
+                return
+            custom_logger_key = self._get_custom_logger_key(callback)
+            if custom_logger_key in existing_custom_logger_keys:
+                verbose_logger.debug(
+                    f"Custom logger of type {type(callback).__name__}, key: {custom_logger_key} already exists in {parent_list}, not adding again.."
+                )
+                continue
+            parent_list.append(callback)
+            existing_custom_logger_keys.add(custom_logger_key)
+
     def add_litellm_success_callback(
         self, callback: Union[CustomLogger, str, Callable]
     ):
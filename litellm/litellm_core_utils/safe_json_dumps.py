@@ -3,9 +3,9 @@ from typing import Any, Union
 from litellm.constants import DEFAULT_MAX_RECURSE_DEPTH
 
 
-def safe_dumps(data: Any, max_depth: int = DEFAULT_MAX_RECURSE_DEPTH) -> str:
+def safe_serialize(data: Any, max_depth: int = DEFAULT_MAX_RECURSE_DEPTH) -> Any:
     """
-    Recursively serialize data while detecting circular references.
+    Recursively convert data into JSON-safe python objects while detecting circular references.
     If a circular reference is detected then a marker string is returned.
     """
 
@@ -47,5 +47,12 @@ def safe_dumps(data: Any, max_depth: int = DEFAULT_MAX_RECURSE_DEPTH) -> str:
             except Exception:
                 return "Unserializable Object"
 
-    safe_data = _serialize(data, set(), 0)
-    return json.dumps(safe_data, default=str)
+    return _serialize(data, set(), 0)
+
+
+def safe_dumps(data: Any, max_depth: int = DEFAULT_MAX_RECURSE_DEPTH) -> str:
+    """
+    Recursively serialize data while detecting circular references.
+    If a circular reference is detected then a marker string is returned.
+    """
+    return json.dumps(safe_serialize(data, max_depth=max_depth), default=str)
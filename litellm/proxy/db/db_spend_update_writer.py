@@ -556,7 +556,7 @@ class DBSpendUpdateWriter:
             and len(user_list_transactions.keys()) > 0
         ):
             for i in range(n_retry_times + 1):
-                start_time = time.time()
+                start_time = time.perf_counter()
                 try:
                     async with prisma_client.db.tx(
                         timeout=timedelta(seconds=60)
@@ -611,7 +611,7 @@ class DBSpendUpdateWriter:
         )
         if key_list_transactions is not None and len(key_list_transactions.keys()) > 0:
             for i in range(n_retry_times + 1):
-                start_time = time.time()
+                start_time = time.perf_counter()
                 try:
                     async with prisma_client.db.tx(
                         timeout=timedelta(seconds=60)
@@ -652,7 +652,7 @@ class DBSpendUpdateWriter:
             and len(team_list_transactions.keys()) > 0
         ):
             for i in range(n_retry_times + 1):
-                start_time = time.time()
+                start_time = time.perf_counter()
                 try:
                     async with prisma_client.db.tx(
                         timeout=timedelta(seconds=60)
@@ -702,7 +702,7 @@ class DBSpendUpdateWriter:
             and len(team_member_list_transactions.keys()) > 0
         ):
             for i in range(n_retry_times + 1):
-                start_time = time.time()
+                start_time = time.perf_counter()
                 try:
                     async with prisma_client.db.tx(
                         timeout=timedelta(seconds=60)
@@ -744,7 +744,7 @@ class DBSpendUpdateWriter:
         )
         if org_list_transactions is not None and len(org_list_transactions.keys()) > 0:
             for i in range(n_retry_times + 1):
-                start_time = time.time()
+                start_time = time.perf_counter()
                 try:
                     async with prisma_client.db.tx(
                         timeout=timedelta(seconds=60)
@@ -844,7 +844,7 @@ class DBSpendUpdateWriter:
             f"Daily {entity_type.capitalize()} Spend transactions: {len(daily_spend_transactions)}"
         )
         BATCH_SIZE = 100
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             for i in range(n_retry_times + 1):
@@ -959,7 +959,7 @@ class DBSpendUpdateWriter:
                             )
 
                     verbose_proxy_logger.info(
-                        f"Processed {len(transactions_to_process)} daily {entity_type} transactions in {time.time() - start_time:.2f}s"
+                        f"Processed {len(transactions_to_process)} daily {entity_type} transactions in {time.perf_counter() - start_time:.2f}s"
                     )
 
                     # Remove processed transactions
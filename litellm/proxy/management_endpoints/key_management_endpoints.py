@@ -1019,7 +1019,10 @@ async def update_key_fn(
         )
 
         existing_key_row = await prisma_client.get_data(
-            token=data.key, table_name="key", query_type="find_unique"
+            token=data.key,
+            table_name="key",
+            query_type="find_unique",
+            include_budget=False,  # update checks don't read litellm_budget_table
         )
 
         if existing_key_row is None:
@@ -1,28 +1,41 @@
 import asyncio
 import copy
+import functools
 import hashlib
+import inspect
+import itertools
 import json
+import logging
+import math
 import os
+import re
 import smtplib
-import threading
 import time
 import traceback
-from datetime import datetime, timedelta
+import uuid
+from datetime import date, datetime, timedelta
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    FrozenSet,
     List,
     Literal,
     Optional,
+    Tuple,
+    Type,
     Union,
     cast,
     overload,
 )
 
-from litellm.constants import MAX_TEAM_LIST_LIMIT
+from litellm.constants import (
+    MAX_SIZE_PROXY_HOOK_QUEUE,
+    MAX_TEAM_LIST_LIMIT,
+    PROXY_HOOK_QUEUE_NUM_WORKERS,
+)
 from litellm.proxy._types import (
     DB_CONNECTION_ERROR_TYPES,
     CommonProxyErrors,
@@ -40,7 +53,9 @@ except ImportError:
         "backoff is not installed. Please install it via 'pip install backoff'"
     )
 
+import orjson
 from fastapi import HTTPException, status
+from pydantic import BaseModel
 
 import litellm
 import litellm.litellm_core_utils
@@ -61,9 +76,10 @@ from litellm.integrations.custom_logger import CustomLogger
 from litellm.integrations.SlackAlerting.slack_alerting import SlackAlerting
 from litellm.integrations.SlackAlerting.utils import _add_langfuse_trace_id_to_alert
 from litellm.litellm_core_utils.litellm_logging import Logging
-from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
-from litellm.litellm_core_utils.safe_json_loads import safe_json_loads
-from litellm.llms.custom_httpx.httpx_handler import HTTPHandler
+from litellm.litellm_core_utils.rules import Rules
+from litellm.litellm_core_utils.safe_json_dumps import safe_dumps, safe_serialize
+from litellm.litellm_core_utils.thread_pool_executor import executor
+from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
 from litellm.proxy._types import (
     AlertType,
     CallInfo,
@@ -106,13 +122,34 @@ def print_verbose(print_statement):
     :param print_statement: The statement to be printed and logged.
     :type print_statement: Any
     """
-    import traceback
-
-    verbose_proxy_logger.debug("{}\n{}".format(print_statement, traceback.format_exc()))
+    if verbose_proxy_logger.isEnabledFor(logging.DEBUG):
+        verbose_proxy_logger.debug("%s\n%s", print_statement, traceback.format_exc())
     if litellm.set_verbose:
         print(f"LiteLLM Proxy: {print_statement}")  # noqa
 
 
+# (request_data key, expected type, call type) checked in order to find the logged input
+_PROXY_ONLY_ERROR_INPUT_KEYS: Tuple[Tuple[str, Type[Union[list, str, dict]], str], ...] = (
+    ("messages", list, CallTypes.acompletion.value),
+    ("prompt", str, CallTypes.atext_completion.value),
+    ("input", list, CallTypes.aembedding.value),
+)
+
+# hook events that are never dropped when the hook queue is full - they run in their own task instead
+_UNDROPPABLE_HOOK_EVENT_KINDS: FrozenSet[str] = frozenset(
+    {"alert", "post_call_failure", "db_failure"}
+)
+
+# Rules is stateless - share one instance across proxy-only error logging calls
+_PROXY_RULES_OBJ = Rules()
+
+_LOGGED_LITELLM_PARAM_KEYS: FrozenSet[str] = frozenset(
+    LoggedLiteLLMParams.__annotations__.keys()
+)
+# request_data keys logged separately, not as optional params
+_NON_OPTIONAL_PARAM_KEYS: FrozenSet[str] = frozenset(("model", "user"))
+
+
 def safe_deep_copy(data):
     """
     Safe Deep Copy
@@ -124,20 +161,26 @@ def safe_deep_copy(data):
     if litellm.safe_memory_mode is True:
         return data
 
-    litellm_parent_otel_span: Optional[Any] = None
-    # Step 1: Remove the litellm_parent_otel_span
-    litellm_parent_otel_span = None
+    memo: Dict[int, Any] = {}
     if isinstance(data, dict):
-        # remove litellm_parent_otel_span since this is not picklable
-        if "metadata" in data and "litellm_parent_otel_span" in data["metadata"]:
-            litellm_parent_otel_span = data["metadata"].pop("litellm_parent_otel_span")
-    new_data = copy.deepcopy(data)
+        metadata = data.get("metadata")
+        if isinstance(metadata, dict) and "litellm_parent_otel_span" in metadata:
+            # litellm_parent_otel_span is not picklable - seed the memo so deepcopy shares it by reference
+            litellm_parent_otel_span = metadata["litellm_parent_otel_span"]
+            memo[id(litellm_parent_otel_span)] = litellm_parent_otel_span
+    return copy.deepcopy(data, memo)
+
+
+def _orjson_dumps(value: Any) -> bytes:
+    """
+    Serialize a value to JSON bytes with orjson.
 
-    # Step 2: re-add the litellm_parent_otel_span after doing a deep copy
-    if isinstance(data, dict) and litellm_parent_otel_span is not None:
-        if "metadata" in data:
-            data["metadata"]["litellm_parent_otel_span"] = litellm_parent_otel_span
-    return new_data
+    Falls back to `json.dumps` for values orjson can't encode (e.g. ints > 64 bits).
+    """
+    try:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return json.dumps(value).encode("utf-8")
 
 
 class InternalUsageCache:
@@ -184,6 +227,7 @@ class InternalUsageCache:
         return await self.dual_cache.async_set_cache_pipeline(
             cache_list=cache_list,
             local_only=local_only,
+            serializer=_orjson_dumps,
             litellm_parent_otel_span=litellm_parent_otel_span,
             **kwargs,
         )
@@ -243,6 +287,40 @@ class InternalUsageCache:
         )
 
 
+@functools.lru_cache(maxsize=None)
+def _get_health_check_model() -> Type[Any]:
+    """
+    Returns the generated prisma `LiteLLM_HealthCheckTable` model, imported once.
+
+    prisma.models only exists after `prisma generate`, which runs at proxy startup - after this module is imported.
+    A failed import is not cached, so it's retried on the next call.
+    """
+    from prisma.models import LiteLLM_HealthCheckTable  # type: ignore
+
+    return LiteLLM_HealthCheckTable
+
+
+@functools.lru_cache(maxsize=None)
+def _get_proxy_server_module():
+    """
+    Returns the `litellm.proxy.proxy_server` module, imported once.
+
+    proxy_server imports this module, so it can't be imported at module top.
+    Read attributes off the returned module at call time (e.g. `prisma_client`) - they are re-assigned on startup.
+    """
+    from litellm.proxy import proxy_server
+
+    return proxy_server
+
+
+@functools.lru_cache(maxsize=None)
+def _get_proxy_hook_expected_args(proxy_hook: type) -> tuple:
+    """
+    Returns the `__init__` args of a proxy hook class. Cached per hook class.
+    """
+    return tuple(inspect.getfullargspec(proxy_hook).args)
+
+
 ### LOGGING ###
 class ProxyLogging:
     """
@@ -271,7 +349,7 @@ class ProxyLogging:
         self.cache_control_check = _PROXY_CacheControlCheck()
         self.alerting: Optional[List] = None
         self.alerting_threshold: float = 300  # default to 5 min. threshold
-        self.alert_types: List[AlertType] = DEFAULT_ALERT_TYPES
+        self.alert_types = DEFAULT_ALERT_TYPES
         self.alert_to_webhook_url: Optional[dict] = None
         self.slack_alerting_instance: SlackAlerting = SlackAlerting(
             alerting_threshold=self.alerting_threshold,
@@ -287,6 +365,37 @@ class ProxyLogging:
         self.daily_report_started: bool = False
         self.hanging_requests_check_started: bool = False
 
+        # string callback name -> initialized CustomLogger instance
+        self._resolved_callback_cache: Dict[str, CustomLogger] = {}
+        # resolved callbacks + the ones that implement the pre / during call hooks, rebuilt when litellm.callbacks changes
+        self._resolved_callbacks: List[Tuple[CustomLogger, bool]] = []
+        self._pre_call_hook_callbacks: List[CustomLogger] = []
+        self._during_call_hook_callbacks: List[CustomGuardrail] = []
+        self._hook_callbacks_key: Optional[Tuple[int, ...]] = None
+        self._hook_callbacks_fully_resolved: bool = False
+
+        # bounded queue for background alerting / failure hook work, drained by a fixed pool of workers (created lazily)
+        self._hook_queue: Optional[asyncio.Queue] = None
+        self._hook_worker_tasks: List[asyncio.Task] = []
+        self._hook_events_dropped: int = 0
+        self._hook_events_overflowed: int = 0
+
+    @property
+    def alert_types(self) -> List[AlertType]:
+        return self._alert_types
+
+    @alert_types.setter
+    def alert_types(self, alert_types: List[AlertType]):
+        self._alert_types = alert_types
+        # O(1) membership checks on the failure path
+        self._alert_types_set: FrozenSet[AlertType] = frozenset(alert_types)
+
+    def is_alert_type_enabled(self, alert_type: AlertType) -> bool:
+        """
+        O(1) check whether `alert_type` is in the configured alert types
+        """
+        return alert_type in self._alert_types_set
+
     def startup_event(
         self,
         llm_router: Optional[Router],
@@ -382,22 +491,113 @@ class ProxyLogging:
         """
         Add proxy hooks to litellm.callbacks
         """
-        from litellm.proxy.proxy_server import prisma_client
+        prisma_client = _get_proxy_server_module().prisma_client
 
+        proxy_hook_objs: List[CustomLogger] = []
         for hook in PROXY_HOOKS:
             proxy_hook = get_proxy_hook(hook)
-            import inspect
-
-            expected_args = inspect.getfullargspec(proxy_hook).args
+            expected_args = _get_proxy_hook_expected_args(proxy_hook)
             passed_in_args: Dict[str, Any] = {}
             if "internal_usage_cache" in expected_args:
                 passed_in_args["internal_usage_cache"] = self.internal_usage_cache
             if "prisma_client" in expected_args:
                 passed_in_args["prisma_client"] = prisma_client
             proxy_hook_obj = cast(CustomLogger, proxy_hook(**passed_in_args))
-            litellm.logging_callback_manager.add_litellm_callback(proxy_hook_obj)
+            proxy_hook_objs.append(proxy_hook_obj)
 
             self.proxy_hook_mapping[hook] = proxy_hook_obj
+        litellm.logging_callback_manager.add_litellm_callbacks(proxy_hook_objs)
+
+    def _resolve_callback(self, callback: Any) -> Optional[CustomLogger]:
+        """
+        Resolve a `litellm.callbacks` entry to its CustomLogger instance.
+
+        String callbacks (e.g. "langsmith") are looked up once and cached.
+        """
+        if not isinstance(callback, str):
+            return callback
+        _callback = self._resolved_callback_cache.get(callback)
+        if _callback is None:
+            _callback = litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class(
+                callback  # type: ignore
+            )
+            if _callback is not None:
+                self._resolved_callback_cache[callback] = _callback
+        return _callback
+
+    def _refresh_hook_callbacks(self) -> None:
+        """
+        Rebuild the cached callback lists if `litellm.callbacks` changed.
+
+        - resolved: (CustomLogger instance, is CustomGuardrail) for every resolvable callback
+        - pre call: CustomGuardrail instances + CustomLogger instances that override `async_pre_call_hook`
+        - during call: CustomGuardrail instances
+
+        should_run_guardrail is still checked per request.
+        """
+        # identity of every entry, so in-place swaps at the same length are picked up.
+        # the cached lists below hold the callbacks, so their ids can't be reused while cached
+        callbacks_key = tuple(map(id, litellm.callbacks))
+        if callbacks_key == self._hook_callbacks_key:
+            if self._hook_callbacks_fully_resolved:
+                return
+        else:
+            # drop string callback resolutions that may point at removed loggers
+            self._resolved_callback_cache = {}
+
+        resolved_callbacks: List[Tuple[CustomLogger, bool]] = []
+        pre_call_hook_callbacks: List[CustomLogger] = []
+        during_call_hook_callbacks: List[CustomGuardrail] = []
+        is_fully_resolved = True
+        for callback in litellm.callbacks:
+            is_guardrail = False
+            if isinstance(callback, CustomGuardrail):
+                is_guardrail = True
+                during_call_hook_callbacks.append(callback)
+            _callback = self._resolve_callback(callback)
+            if _callback is None:
+                # logger not initialized yet, re-check on the next request
+                is_fully_resolved = False
+                continue
+            if isinstance(_callback, CustomLogger):
+                resolved_callbacks.append((_callback, is_guardrail))
+            if isinstance(_callback, CustomGuardrail):
+                pre_call_hook_callbacks.append(_callback)
+            elif (
+                isinstance(_callback, CustomLogger)
+                and "async_pre_call_hook" in vars(_callback.__class__)
+                and _callback.__class__.async_pre_call_hook
+                != CustomLogger.async_pre_call_hook
+            ):
+                pre_call_hook_callbacks.append(_callback)
+
+        self._resolved_callbacks = resolved_callbacks
+        self._pre_call_hook_callbacks = pre_call_hook_callbacks
+        self._during_call_hook_callbacks = during_call_hook_callbacks
+        self._hook_callbacks_key = callbacks_key
+        # logger not initialized yet -> re-check on the next request
+        self._hook_callbacks_fully_resolved = is_fully_resolved
+
+    def _get_resolved_callbacks(self) -> List[Tuple[CustomLogger, bool]]:
+        """
+        Get `litellm.callbacks` resolved to CustomLogger instances, paired with whether each is a CustomGuardrail
+        """
+        self._refresh_hook_callbacks()
+        return self._resolved_callbacks
+
+    def _get_pre_call_hook_callbacks(self) -> List[CustomLogger]:
+        """
+        Get the callbacks that should run on `pre_call_hook`
+        """
+        self._refresh_hook_callbacks()
+        return self._pre_call_hook_callbacks
+
+    def _get_during_call_hook_callbacks(self) -> List[CustomGuardrail]:
+        """
+        Get the guardrails that should run on `during_call_hook`
+        """
+        self._refresh_hook_callbacks()
+        return self._during_call_hook_callbacks
 
     def get_proxy_hook(self, hook: str) -> Optional[CustomLogger]:
         """
@@ -406,8 +606,35 @@ class ProxyLogging:
         return self.proxy_hook_mapping.get(hook)
 
     def _init_litellm_callbacks(self, llm_router: Optional[Router] = None):
+        self._resolved_callback_cache = {}
         self._add_proxy_hooks(llm_router)
         litellm.logging_callback_manager.add_litellm_callback(self.service_logging_obj)  # type: ignore
+
+        # (callback list, how to register a callback on it)
+        callback_registrars: List[Tuple[list, Any]] = [
+            (litellm.input_callback, litellm.input_callback.append),
+            (
+                litellm.success_callback,
+                litellm.logging_callback_manager.add_litellm_success_callback,
+            ),
+            (
+                litellm.failure_callback,
+                litellm.logging_callback_manager.add_litellm_failure_callback,
+            ),
+            (
+                litellm._async_success_callback,
+                litellm.logging_callback_manager.add_litellm_async_success_callback,
+            ),
+            (
+                litellm._async_failure_callback,
+                litellm.logging_callback_manager.add_litellm_async_failure_callback,
+            ),
+            (litellm.service_callback, litellm.service_callback.append),
+        ]
+        # ids of the callbacks already on each list - avoids an O(n) `in` check per list per callback
+        registered_callback_ids = [
+            {id(cb) for cb in callback_list} for callback_list, _ in callback_registrars
+        ]
         for callback in litellm.callbacks:
             if isinstance(callback, str):
                 callback = litellm.litellm_core_utils.litellm_logging._init_custom_logger_compatible_class(  # type: ignore
@@ -417,29 +644,27 @@ class ProxyLogging:
                 )
                 if callback is None:
                     continue
-            if callback not in litellm.input_callback:
-                litellm.input_callback.append(callback)  # type: ignore
-            if callback not in litellm.success_callback:
-                litellm.logging_callback_manager.add_litellm_success_callback(callback)  # type: ignore
-            if callback not in litellm.failure_callback:
-                litellm.logging_callback_manager.add_litellm_failure_callback(callback)  # type: ignore
-            if callback not in litellm._async_success_callback:
-                litellm.logging_callback_manager.add_litellm_async_success_callback(callback)  # type: ignore
-            if callback not in litellm._async_failure_callback:
-                litellm.logging_callback_manager.add_litellm_async_failure_callback(callback)  # type: ignore
-            if callback not in litellm.service_callback:
-                litellm.service_callback.append(callback)  # type: ignore
+            callback_id = id(callback)
+            for (_, register_callback), callback_ids in zip(
+                callback_registrars, registered_callback_ids
+            ):
+                if callback_id not in callback_ids:
+                    register_callback(callback)  # type: ignore
+                    callback_ids.add(callback_id)
 
         if (
             len(litellm.input_callback) > 0
             or len(litellm.success_callback) > 0
             or len(litellm.failure_callback) > 0
         ):
+            # dedupe in a single pass, preserving registration order
             callback_list = list(
-                set(
-                    litellm.input_callback
-                    + litellm.success_callback
-                    + litellm.failure_callback
+                dict.fromkeys(
+                    itertools.chain(
+                        litellm.input_callback,
+                        litellm.success_callback,
+                        litellm.failure_callback,
+                    )
                 )
             )
             litellm.litellm_core_utils.litellm_logging.set_callbacks(
@@ -460,12 +685,13 @@ class ProxyLogging:
         # ensures we don't send errant hanging request slack alerts
         alerting_threshold += 100
 
-        await self.internal_usage_cache.async_set_cache(
+        # request status is only ever read from the in-memory cache (see HangingRequestCheck),
+        # so write it synchronously - there is no redis round trip to batch here
+        self.internal_usage_cache.set_cache(
             key="request_status:{}".format(litellm_call_id),
             value=status,
             local_only=True,
             ttl=alerting_threshold,
-            litellm_parent_otel_span=None,
         )
 
     async def process_pre_call_hook_response(self, response, data, call_type):
@@ -552,18 +778,14 @@ class ProxyLogging:
         if data is None:
             return None
 
-        try:
-            for callback in litellm.callbacks:
-                _callback = None
-                if isinstance(callback, str):
-                    _callback = litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class(
-                        callback
-                    )
-                else:
-                    _callback = callback  # type: ignore
-                if _callback is not None and isinstance(_callback, CustomGuardrail):
-                    from litellm.types.guardrails import GuardrailEventHooks
+        pre_call_hook_callbacks = self._get_pre_call_hook_callbacks()
+        if not pre_call_hook_callbacks:
+            return data
 
+        user_api_key_cache = self.call_details["user_api_key_cache"]
+        try:
+            for _callback in pre_call_hook_callbacks:
+                if isinstance(_callback, CustomGuardrail):
                     if (
                         _callback.should_run_guardrail(
                             data=data, event_type=GuardrailEventHooks.pre_call
@@ -572,34 +794,16 @@ class ProxyLogging:
                     ):
                         continue
 
-                    response = await _callback.async_pre_call_hook(
-                        user_api_key_dict=user_api_key_dict,
-                        cache=self.call_details["user_api_key_cache"],
-                        data=data,  # type: ignore
-                        call_type=call_type,
+                response = await _callback.async_pre_call_hook(
+                    user_api_key_dict=user_api_key_dict,
+                    cache=user_api_key_cache,
+                    data=data,  # type: ignore
+                    call_type=call_type,
+                )
+                if response is not None:
+                    data = await self.process_pre_call_hook_response(
+                        response=response, data=data, call_type=call_type
                     )
-                    if response is not None:
-                        data = await self.process_pre_call_hook_response(
-                            response=response, data=data, call_type=call_type
-                        )
-
-                elif (
-                    _callback is not None
-                    and isinstance(_callback, CustomLogger)
-                    and "async_pre_call_hook" in vars(_callback.__class__)
-                    and _callback.__class__.async_pre_call_hook
-                    != CustomLogger.async_pre_call_hook
-                ):
-                    response = await _callback.async_pre_call_hook(
-                        user_api_key_dict=user_api_key_dict,
-                        cache=self.call_details["user_api_key_cache"],
-                        data=data,  # type: ignore
-                        call_type=call_type,
-                    )
-                    if response is not None:
-                        data = await self.process_pre_call_hook_response(
-                            response=response, data=data, call_type=call_type
-                        )
 
             return data
         except Exception as e:
@@ -621,35 +825,32 @@ class ProxyLogging:
         """
         Runs the CustomGuardrail's async_moderation_hook()
         """
-        for callback in litellm.callbacks:
+        for callback in self._get_during_call_hook_callbacks():
             try:
-                if isinstance(callback, CustomGuardrail):
-                    ################################################################
-                    # Check if guardrail should be run for GuardrailEventHooks.during_call hook
-                    ################################################################
-
-                    # V1 implementation - backwards compatibility
-                    if callback.event_hook is None and hasattr(
-                        callback, "moderation_check"
-                    ):
-                        if callback.moderation_check == "pre_call":  # type: ignore
-                            return
-                    else:
-                        # Main - V2 Guardrails implementation
-                        from litellm.types.guardrails import GuardrailEventHooks
+                ################################################################
+                # Check if guardrail should be run for GuardrailEventHooks.during_call hook
+                ################################################################
 
-                        if (
-                            callback.should_run_guardrail(
-                                data=data, event_type=GuardrailEventHooks.during_call
-                            )
-                            is not True
-                        ):
-                            continue
-                    await callback.async_moderation_hook(
-                        data=data,
-                        user_api_key_dict=user_api_key_dict,
-                        call_type=call_type,
-                    )
+                # V1 implementation - backwards compatibility
+                if callback.event_hook is None and hasattr(
+                    callback, "moderation_check"
+                ):
+                    if callback.moderation_check == "pre_call":  # type: ignore
+                        return
+                else:
+                    # Main - V2 Guardrails implementation
+                    if (
+                        callback.should_run_guardrail(
+                            data=data, event_type=GuardrailEventHooks.during_call
+                        )
+                        is not True
+                    ):
+                        continue
+                await callback.async_moderation_hook(
+                    data=data,
+                    user_api_key_dict=user_api_key_dict,
+                    call_type=call_type,
+                )
             except Exception as e:
                 raise e
         return data
@@ -712,10 +913,9 @@ class ProxyLogging:
         if self.alerting is None:
             return
 
-        from datetime import datetime
-
         # Get the current timestamp
-        current_time = datetime.now().strftime("%H:%M:%S")
+        _local_time = time.localtime()
+        current_time = f"{_local_time.tm_hour:02d}:{_local_time.tm_min:02d}:{_local_time.tm_sec:02d}"
         _proxy_base_url = os.getenv("PROXY_BASE_URL", None)
         formatted_message = (
             f"Level: `{level}`\nTimestamp: `{current_time}`\n\nMessage: {message}"
@@ -753,6 +953,106 @@ class ProxyLogging:
                 else:
                     raise Exception("Missing SENTRY_DSN from environment")
 
+    def _enqueue_hook_event(
+        self, kind: str, payload: dict, callback: Optional[CustomLogger] = None
+    ) -> None:
+        """
+        Queue background hook work for the hook workers, instead of creating a task per call.
+
+        kind:
+            - "alert": `alerting_handler(**payload)`
+            - "post_call_failure": `callback.async_post_call_failure_hook(**payload)`
+            - "response_taking_too_long": `slack_alerting_instance.response_taking_too_long(**payload)`
+            - "db_failure": `failure_handler(**payload)`
+
+        The queue is bounded. When it's full, alert / failure events (`_UNDROPPABLE_HOOK_EVENT_KINDS`)
+        run in their own task instead, and any other event is dropped.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._hook_queue is None
+            or not self._hook_worker_tasks
+            or self._hook_worker_tasks[0].get_loop() is not loop
+        ):
+            self._hook_queue = asyncio.Queue(maxsize=MAX_SIZE_PROXY_HOOK_QUEUE)
+            self._hook_worker_tasks = [
+                loop.create_task(self._hook_worker(self._hook_queue))
+                for _ in range(PROXY_HOOK_QUEUE_NUM_WORKERS)
+            ]
+        elif any(task.done() for task in self._hook_worker_tasks):
+            # restart dead workers, keeping the events already queued
+            self._hook_worker_tasks = [
+                loop.create_task(self._hook_worker(self._hook_queue))
+                if task.done()
+                else task
+                for task in self._hook_worker_tasks
+            ]
+
+        try:
+            self._hook_queue.put_nowait((kind, callback, payload))
+        except asyncio.QueueFull:
+            if kind in _UNDROPPABLE_HOOK_EVENT_KINDS:
+                self._hook_events_overflowed += 1
+                verbose_proxy_logger.warning(
+                    "Proxy hook queue full, running %s event in its own task. Total overflowed: %s",
+                    kind,
+                    self._hook_events_overflowed,
+                )
+                loop.create_task(
+                    self._run_hook_event(kind=kind, callback=callback, payload=payload)
+                )
+            else:
+                self._hook_events_dropped += 1
+                verbose_proxy_logger.warning(
+                    "Proxy hook queue full, dropped %s event. Total dropped: %s",
+                    kind,
+                    self._hook_events_dropped,
+                )
+
+    async def _run_hook_event(
+        self, kind: str, callback: Optional[CustomLogger], payload: dict
+    ) -> None:
+        try:
+            if kind == "alert":
+                await self.alerting_handler(**payload)
+            elif kind == "post_call_failure" and callback is not None:
+                await callback.async_post_call_failure_hook(**payload)
+            elif kind == "db_failure":
+                await self.failure_handler(**payload)
+            elif kind == "response_taking_too_long":
+                await self.slack_alerting_instance.response_taking_too_long(**payload)
+        except Exception as e:
+            verbose_proxy_logger.exception(
+                f"[Non-Blocking] Error in proxy hook worker ({kind}): {e}"
+            )
+
+    async def _hook_worker(self, hook_queue: asyncio.Queue) -> None:
+        """
+        Run queued hook events one at a time
+        """
+        while True:
+            kind, callback, payload = await hook_queue.get()
+            try:
+                await self._run_hook_event(kind=kind, callback=callback, payload=payload)
+            finally:
+                hook_queue.task_done()
+
+    def log_db_failure(
+        self, original_exception, duration: float, call_type: str, traceback_str=""
+    ) -> None:
+        """
+        Queue `failure_handler` on the hook workers. Never dropped - runs in its own task if the queue is full
+        """
+        self._enqueue_hook_event(
+            kind="db_failure",
+            payload={
+                "original_exception": original_exception,
+                "duration": duration,
+                "call_type": call_type,
+                "traceback_str": traceback_str,
+            },
+        )
+
     async def failure_handler(
         self, original_exception, duration: float, call_type: str, traceback_str=""
     ):
@@ -762,26 +1062,27 @@ class ProxyLogging:
         Currently only logs exceptions to sentry
         """
         ### ALERTING ###
-        if AlertType.db_exceptions not in self.alert_types:
+        if AlertType.db_exceptions not in self._alert_types_set:
             return
         if isinstance(original_exception, HTTPException):
             if isinstance(original_exception.detail, str):
                 error_message = original_exception.detail
             elif isinstance(original_exception.detail, dict):
-                error_message = json.dumps(original_exception.detail)
+                error_message = safe_dumps(original_exception.detail)
             else:
                 error_message = str(original_exception)
         else:
             error_message = str(original_exception)
         if isinstance(traceback_str, str):
             error_message += traceback_str[:1000]
-        asyncio.create_task(
-            self.alerting_handler(
-                message=f"DB read/write call failed: {error_message}",
-                level="High",
-                alert_type=AlertType.db_exceptions,
-                request_data={},
-            )
+        self._enqueue_hook_event(
+            kind="alert",
+            payload={
+                "message": f"DB read/write call failed: {error_message}",
+                "level": "High",
+                "alert_type": AlertType.db_exceptions,
+                "request_data": {},
+            },
         )
 
         if hasattr(self, "service_logging_obj"):
@@ -825,26 +1126,28 @@ class ProxyLogging:
         await self.update_request_status(
             litellm_call_id=request_data.get("litellm_call_id", ""), status="fail"
         )
-        if AlertType.llm_exceptions in self.alert_types and not isinstance(
-            original_exception, HTTPException
+        if (
+            self.alerting
+            and AlertType.llm_exceptions in self._alert_types_set
+            and not isinstance(original_exception, HTTPException)
         ):
             """
             Just alert on LLM API exceptions. Do not alert on user errors
 
             Related issue - https://github.com/BerriAI/litellm/issues/3395
             """
-            litellm_debug_info = getattr(original_exception, "litellm_debug_info", None)
-            exception_str = str(original_exception)
-            if litellm_debug_info is not None:
-                exception_str += litellm_debug_info
+            litellm_debug_info = (
+                getattr(original_exception, "litellm_debug_info", None) or ""
+            )
 
-            asyncio.create_task(
-                self.alerting_handler(
-                    message=f"LLM API call failed: `{exception_str}`",
-                    level="High",
-                    alert_type=AlertType.llm_exceptions,
-                    request_data=request_data,
-                )
+            self._enqueue_hook_event(
+                kind="alert",
+                payload={
+                    "message": f"LLM API call failed: `{original_exception}{litellm_debug_info}`",
+                    "level": "High",
+                    "alert_type": AlertType.llm_exceptions,
+                    "request_data": request_data,
+                },
             )
 
         ### LOGGING ###
@@ -860,24 +1163,21 @@ class ProxyLogging:
                 original_exception=original_exception,
             )
 
-        for callback in litellm.callbacks:
+        # same kwargs for every callback - the hook worker unpacks them per call
+        failure_hook_payload = {
+            "request_data": request_data,
+            "user_api_key_dict": user_api_key_dict,
+            "original_exception": original_exception,
+            "traceback_str": traceback_str,
+        }
+        enqueue_hook_event = self._enqueue_hook_event
+        for _callback, _ in self._get_resolved_callbacks():
             try:
-                _callback: Optional[CustomLogger] = None
-                if isinstance(callback, str):
-                    _callback = litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class(
-                        callback
-                    )
-                else:
-                    _callback = callback  # type: ignore
-                if _callback is not None and isinstance(_callback, CustomLogger):
-                    asyncio.create_task(
-                        _callback.async_post_call_failure_hook(
-                            request_data=request_data,
-                            user_api_key_dict=user_api_key_dict,
-                            original_exception=original_exception,
-                            traceback_str=traceback_str,
-                        )
-                    )
+                enqueue_hook_event(
+                    kind="post_call_failure",
+                    callback=_callback,
+                    payload=failure_hook_payload,
+                )
             except Exception as e:
                 verbose_proxy_logger.exception(
                     f"[Non-Blocking] Error in post_call_failure_hook: {e}"
@@ -932,8 +1232,6 @@ class ProxyLogging:
             "litellm_logging_obj", None
         )
         if litellm_logging_obj is None:
-            import uuid
-
             request_data["litellm_call_id"] = str(uuid.uuid4())
             user_api_key_logged_metadata = (
                 LiteLLMProxyRequestSetup.get_sanitized_user_information_from_key(
@@ -943,7 +1241,7 @@ class ProxyLogging:
 
             litellm_logging_obj, data = litellm.utils.function_setup(
                 original_function=route or "IGNORE_THIS",
-                rules_obj=litellm.utils.Rules(),
+                rules_obj=_PROXY_RULES_OBJ,
                 start_time=datetime.now(),
                 **request_data,
             )
@@ -956,11 +1254,10 @@ class ProxyLogging:
             _optional_params = {}
             _litellm_params = {}
 
-            litellm_param_keys = LoggedLiteLLMParams.__annotations__.keys()
             for k, v in request_data.items():
-                if k in litellm_param_keys:
+                if k in _LOGGED_LITELLM_PARAM_KEYS:
                     _litellm_params[k] = v
-                elif k != "model" and k != "user":
+                elif k not in _NON_OPTIONAL_PARAM_KEYS:
                     _optional_params[k] = v
 
             litellm_logging_obj.update_environment_variables(
@@ -971,38 +1268,30 @@ class ProxyLogging:
             )
 
             input: Union[list, str, dict] = ""
-            if "messages" in request_data and isinstance(
-                request_data["messages"], list
-            ):
-                input = request_data["messages"]
-                litellm_logging_obj.model_call_details["messages"] = input
-                litellm_logging_obj.call_type = CallTypes.acompletion.value
-            elif "prompt" in request_data and isinstance(request_data["prompt"], str):
-                input = request_data["prompt"]
-                litellm_logging_obj.model_call_details["prompt"] = input
-                litellm_logging_obj.call_type = CallTypes.atext_completion.value
-            elif "input" in request_data and isinstance(request_data["input"], list):
-                input = request_data["input"]
-                litellm_logging_obj.model_call_details["input"] = input
-                litellm_logging_obj.call_type = CallTypes.aembedding.value
+            for input_key, input_type, call_type in _PROXY_ONLY_ERROR_INPUT_KEYS:
+                value = request_data.get(input_key)
+                if isinstance(value, input_type):
+                    input = value
+                    litellm_logging_obj.model_call_details[input_key] = value
+                    litellm_logging_obj.call_type = call_type
+                    break
             litellm_logging_obj.pre_call(
                 input=input,
                 api_key="",
             )
 
             # log the custom exception
+            traceback_str = traceback.format_exc()
             await litellm_logging_obj.async_failure_handler(
                 exception=original_exception,
-                traceback_exception=traceback.format_exc(),
+                traceback_exception=traceback_str,
             )
 
-            threading.Thread(
-                target=litellm_logging_obj.failure_handler,
-                args=(
-                    original_exception,
-                    traceback.format_exc(),
-                ),
-            ).start()
+            executor.submit(
+                litellm_logging_obj.failure_handler,
+                original_exception,
+                traceback_str,
+            )
 
     async def post_call_success_hook(
         self,
@@ -1020,47 +1309,28 @@ class ProxyLogging:
         4. /files
         """
 
-        for callback in litellm.callbacks:
-            try:
-                _callback: Optional[CustomLogger] = None
-                if isinstance(callback, str):
-                    _callback = litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class(
-                        callback
+        # hooks run one at a time in callback order - they may modify data / response
+        # in place, and a hook that raises stops the ones after it
+        for _callback, is_guardrail in self._get_resolved_callbacks():
+            ############## Handle Guardrails ########################################
+            #############################################################################
+            if is_guardrail:
+                # Main - V2 Guardrails implementation
+                if (
+                    cast(CustomGuardrail, _callback).should_run_guardrail(
+                        data=data, event_type=GuardrailEventHooks.post_call
                     )
-                else:
-                    _callback = callback  # type: ignore
-
-                if _callback is not None:
-                    ############## Handle Guardrails ########################################
-                    #############################################################################
-                    if isinstance(callback, CustomGuardrail):
-                        # Main - V2 Guardrails implementation
-                        from litellm.types.guardrails import GuardrailEventHooks
-
-                        if (
-                            callback.should_run_guardrail(
-                                data=data, event_type=GuardrailEventHooks.post_call
-                            )
-                            is not True
-                        ):
-                            continue
-
-                        await callback.async_post_call_success_hook(
-                            user_api_key_dict=user_api_key_dict,
-                            data=data,
-                            response=response,
-                        )
+                    is not True
+                ):
+                    continue
 
-                    ############ Handle CustomLogger ###############################
-                    #################################################################
-                    elif isinstance(_callback, CustomLogger):
-                        await _callback.async_post_call_success_hook(
-                            user_api_key_dict=user_api_key_dict,
-                            data=data,
-                            response=response,
-                        )
-            except Exception as e:
-                raise e
+            ############ Handle CustomLogger ###############################
+            #################################################################
+            await _callback.async_post_call_success_hook(
+                user_api_key_dict=user_api_key_dict,
+                data=data,
+                response=response,
+            )
         return response
 
     async def async_post_call_streaming_hook(
@@ -1077,36 +1347,28 @@ class ProxyLogging:
         Covers:
         1. /chat/completions
         """
+        resolved_callbacks = self._get_resolved_callbacks()
+        if not resolved_callbacks:
+            # nothing to run - skip building the response string for this chunk
+            return response
+
         response_str: Optional[str] = None
         if isinstance(response, (ModelResponse, ModelResponseStream)):
             response_str = litellm.get_response_string(response_obj=response)
         if response_str is not None:
-            for callback in litellm.callbacks:
-                try:
-                    _callback: Optional[CustomLogger] = None
-                    if isinstance(callback, CustomGuardrail):
-                        # Main - V2 Guardrails implementation
-                        from litellm.types.guardrails import GuardrailEventHooks
-
-                        if (
-                            callback.should_run_guardrail(
-                                data=data, event_type=GuardrailEventHooks.post_call
-                            )
-                            is not True
-                        ):
-                            continue
-                    if isinstance(callback, str):
-                        _callback = litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class(
-                            callback
-                        )
-                    else:
-                        _callback = callback  # type: ignore
-                    if _callback is not None and isinstance(_callback, CustomLogger):
-                        await _callback.async_post_call_streaming_hook(
-                            user_api_key_dict=user_api_key_dict, response=response_str
+            for _callback, is_guardrail in resolved_callbacks:
+                if is_guardrail:
+                    # Main - V2 Guardrails implementation
+                    if (
+                        cast(CustomGuardrail, _callback).should_run_guardrail(
+                            data=data, event_type=GuardrailEventHooks.post_call
                         )
-                except Exception as e:
-                    raise e
+                        is not True
+                    ):
+                        continue
+                await _callback.async_post_call_streaming_hook(
+                    user_api_key_dict=user_api_key_dict, response=response_str
+                )
         return response
 
     def async_post_call_streaming_iterator_hook(
@@ -1122,25 +1384,17 @@ class ProxyLogging:
         Covers:
         1. /chat/completions
         """
-        for callback in litellm.callbacks:
-            _callback: Optional[CustomLogger] = None
-            if isinstance(callback, str):
-                _callback = litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class(
-                    callback
+        for _callback, _ in self._get_resolved_callbacks():
+            if not isinstance(
+                _callback, CustomGuardrail
+            ) or _callback.should_run_guardrail(
+                data=request_data, event_type=GuardrailEventHooks.post_call
+            ):
+                response = _callback.async_post_call_streaming_iterator_hook(
+                    user_api_key_dict=user_api_key_dict,
+                    response=response,
+                    request_data=request_data,
                 )
-            else:
-                _callback = callback  # type: ignore
-            if _callback is not None and isinstance(_callback, CustomLogger):
-                if not isinstance(
-                    _callback, CustomGuardrail
-                ) or _callback.should_run_guardrail(
-                    data=request_data, event_type=GuardrailEventHooks.post_call
-                ):
-                    response = _callback.async_post_call_streaming_iterator_hook(
-                        user_api_key_dict=user_api_key_dict,
-                        response=response,
-                        request_data=request_data,
-                    )
         return response
 
     async def post_call_streaming_hook(
@@ -1153,16 +1407,11 @@ class ProxyLogging:
         - Run through moderation check
         - Reject request if it fails moderation check
         """
-        new_response = copy.deepcopy(response)
-        for callback in litellm.callbacks:
-            try:
-                if isinstance(callback, CustomLogger):
-                    await callback.async_post_call_streaming_hook(
-                        user_api_key_dict=user_api_key_dict, response=new_response
-                    )
-            except Exception as e:
-                raise e
-        return new_response
+        for _callback, _ in self._get_resolved_callbacks():
+            await _callback.async_post_call_streaming_hook(
+                user_api_key_dict=user_api_key_dict, response=response
+            )
+        return response
 
     def _init_response_taking_too_long_task(self, data: Optional[dict] = None):
         """
@@ -1177,8 +1426,8 @@ class ProxyLogging:
             self.slack_alerting_instance
             and self.slack_alerting_instance.alerting is not None
         ):
-            asyncio.create_task(
-                self.slack_alerting_instance.response_taking_too_long(request_data=data)
+            self._enqueue_hook_event(
+                kind="response_taking_too_long", payload={"request_data": data}
             )
 
 
@@ -1186,23 +1435,198 @@ class ProxyLogging:
 # Define the retry decorator with backoff strategy
 # Function to be called whenever a retry is about to happen
 def on_backoff(details):
+    # skip building the message when nothing would log / print it
+    if not litellm.set_verbose and not verbose_proxy_logger.isEnabledFor(
+        logging.DEBUG
+    ):
+        return
     # The 'tries' key in the details dictionary contains the number of completed tries
     print_verbose(f"Backing off... this was attempt #{details['tries']}")
 
 
-def jsonify_object(data: dict) -> dict:
-    db_data = copy.deepcopy(data)
+if hasattr(BaseModel, "model_dump"):
 
-    for k, v in db_data.items():
+    def _model_dump(obj: Any, **kwargs) -> dict:
+        """
+        pydantic v2 `model_dump` - the installed pydantic version is resolved once at import
+        """
+        return obj.model_dump(**kwargs)
+
+else:
+
+    def _model_dump(obj: Any, **kwargs) -> dict:
+        """
+        pydantic v1 `.dict()`
+        """
+        return obj.dict(**kwargs)
+
+
+def jsonify_object(data: dict, json_list_keys: Tuple[str, ...] = ()) -> dict:
+    """
+    Return a new dict with any dict values json dumped. Other values are not copied.
+
+    List values under `json_list_keys` are json dumped as well (e.g. team `members_with_roles`).
+    """
+    db_data = {}
+    for k, v in data.items():
         if isinstance(v, dict):
             try:
-                db_data[k] = json.dumps(v)
+                v = _orjson_dumps(v).decode()
             except Exception:
                 # This avoids Prisma retrying this 5 times, and making 5 clients
-                db_data[k] = "failed-to-serialize-json"
+                v = "failed-to-serialize-json"
+        elif isinstance(v, list) and k in json_list_keys:
+            v = _orjson_dumps(v).decode()
+        db_data[k] = v
     return db_data
 
 
+_EXPECTED_VIEWS: Tuple[str, ...] = (
+    "LiteLLM_VerificationTokenView",
+    "MonthlyGlobalSpend",
+    "Last30dKeysBySpend",
+    "Last30dModelsBySpend",
+    "MonthlyGlobalSpendPerKey",
+    "MonthlyGlobalSpendPerUserPerKey",
+    "Last30dTopEndUsersSpend",
+    "DailyTagSpend",
+)
+_EXPECTED_VIEWS_SET: FrozenSet[str] = frozenset(_EXPECTED_VIEWS)
+_EXPECTED_VIEWS_SQL_LIST = ", ".join(f"'{view}'" for view in _EXPECTED_VIEWS)
+_CHECK_VIEWS_SQL_TEMPLATE = f"""
+                WITH existing_views AS (
+                    SELECT viewname
+                    FROM pg_views
+                    WHERE schemaname = '{{pg_schema}}' AND viewname IN (
+                        {_EXPECTED_VIEWS_SQL_LIST}
+                    )
+                )
+                SELECT
+                    (SELECT COUNT(*) FROM existing_views) AS view_count,
+                    ARRAY_AGG(viewname) AS view_names
+                FROM existing_views
+                """
+
+# token is passed as $1, so the query text is constant and postgres can reuse the plan
+_COMBINED_VIEW_SQL = """
+                        SELECT
+                            v.*,
+                            t.spend AS team_spend,
+                            t.max_budget AS team_max_budget,
+                            t.tpm_limit AS team_tpm_limit,
+                            t.rpm_limit AS team_rpm_limit,
+                            t.models AS team_models,
+                            t.metadata AS team_metadata,
+                            t.blocked AS team_blocked,
+                            t.team_alias AS team_alias,
+                            t.members_with_roles AS team_members_with_roles,
+                            t.organization_id as org_id,
+                            tm.spend AS team_member_spend,
+                            m.aliases AS team_model_aliases,
+                            b.max_budget AS litellm_budget_table_max_budget,
+                            b.tpm_limit AS litellm_budget_table_tpm_limit,
+                            b.rpm_limit AS litellm_budget_table_rpm_limit,
+                            b.model_max_budget as litellm_budget_table_model_max_budget,
+                            b.soft_budget as litellm_budget_table_soft_budget
+                        FROM "LiteLLM_VerificationToken" AS v
+                        LEFT JOIN "LiteLLM_TeamTable" AS t ON v.team_id = t.team_id
+                        LEFT JOIN "LiteLLM_TeamMembership" AS tm ON v.team_id = tm.team_id AND tm.user_id = v.user_id
+                        LEFT JOIN "LiteLLM_ModelTable" m ON t.model_id = m.id
+                        LEFT JOIN "LiteLLM_BudgetTable" AS b ON v.budget_id = b.budget_id
+                        WHERE v.token = $1
+                    """
+
+
+# key aliases are aggregated per row in a subquery, so postgres only runs it for the rows
+# on the requested page (not the whole table). COALESCE keeps `key_aliases` a JSON array
+# for users without keys.
+_USER_LIST_WITH_KEY_ALIASES_SQL = """
+                        SELECT
+                            u.*,
+                            COALESCE(
+                                (
+                                    SELECT json_agg(v.key_alias)
+                                    FROM "LiteLLM_VerificationToken" v
+                                    WHERE v.user_id = u.user_id
+                                ),
+                                '[]'::json
+                            ) AS key_aliases
+                        FROM
+                            "LiteLLM_UserTable" u
+                        ORDER BY u.spend DESC, u.user_id DESC
+                        LIMIT $1
+                        OFFSET $2
+                        """
+
+
+_LATEST_HEALTH_CHECKS_SQL = """
+    SELECT DISTINCT ON (model_name) *
+    FROM "LiteLLM_HealthCheckTable"
+    ORDER BY model_name, checked_at DESC
+"""
+
+
+def _build_token_view(response: dict) -> LiteLLM_VerificationTokenView:
+    """
+    Build the LiteLLM_VerificationTokenView for a combined_view row.
+    """
+    if response["team_models"] is None:
+        response["team_models"] = []
+    if response["team_blocked"] is None:
+        response["team_blocked"] = False
+
+    team_member: Optional[Member] = None
+    if (
+        response["team_members_with_roles"] is not None
+        and response["user_id"] is not None
+    ):
+        ## find the team member corresponding to user id
+        """
+        [
+            {
+                "role": "admin",
+                "user_id": "default_user_id",
+                "user_email": null
+            },
+            {
+                "role": "user",
+                "user_id": null,
+                "user_email": "test@email.com"
+            }
+        ]
+        """
+        user_id = response["user_id"]
+        team_member_raw: Optional[dict] = None
+        for tm in response["team_members_with_roles"]:
+            if tm.get("user_id") == user_id:
+                team_member_raw = tm
+        # only validate the matching member, not one Member per match
+        if team_member_raw is not None:
+            team_member = Member(**team_member_raw)
+    response["team_member"] = team_member
+    token_view = LiteLLM_VerificationTokenView(**response, last_refreshed_at=time.time())
+    _cast_expires_to_isoformat(token_view)
+    return token_view
+
+
+def _cast_expires_to_isoformat(row: Any) -> None:
+    """
+    for prisma we need to cast the expires time to str
+    """
+    expires = row.expires
+    if isinstance(expires, datetime):
+        row.expires = expires.isoformat()
+
+
+# get_generic_data table_name -> prisma model attribute on PrismaClient.db
+_GENERIC_DATA_TABLE_TO_MODEL: Dict[str, str] = {
+    "users": "litellm_usertable",
+    "keys": "litellm_verificationtoken",
+    "config": "litellm_config",
+    "spend": "l",
+}
+
+
 class PrismaClient:
     spend_log_transactions: List = []
 
@@ -1261,7 +1685,7 @@ class PrismaClient:
             )
             if isinstance(payload_metadata, str):
                 payload_metadata_json: Union[Dict, SpendLogsMetadata] = cast(
-                    Dict, json.loads(payload_metadata)
+                    Dict, orjson.loads(payload_metadata)
                 )
             else:
                 payload_metadata_json = payload_metadata
@@ -1278,22 +1702,10 @@ class PrismaClient:
             return "success"
 
     def hash_token(self, token: str):
-        # Hash the string using SHA-256
-        hashed_token = hashlib.sha256(token.encode()).hexdigest()
-
-        return hashed_token
+        return hash_token(token)
 
     def jsonify_object(self, data: dict) -> dict:
-        db_data = copy.deepcopy(data)
-
-        for k, v in db_data.items():
-            if isinstance(v, dict):
-                try:
-                    db_data[k] = json.dumps(v)
-                except Exception:
-                    # This avoids Prisma retrying this 5 times, and making 5 clients
-                    db_data[k] = "failed-to-serialize-json"
-        return db_data
+        return jsonify_object(data)
 
     @backoff.on_exception(
         backoff.expo,
@@ -1317,35 +1729,12 @@ class PrismaClient:
         # This is more efficient because it lets us check for all views in one
         # query instead of multiple queries.
         try:
-            expected_views = [
-                "LiteLLM_VerificationTokenView",
-                "MonthlyGlobalSpend",
-                "Last30dKeysBySpend",
-                "Last30dModelsBySpend",
-                "MonthlyGlobalSpendPerKey",
-                "MonthlyGlobalSpendPerUserPerKey",
-                "Last30dTopEndUsersSpend",
-                "DailyTagSpend",
-            ]
             required_view = "LiteLLM_VerificationTokenView"
-            expected_views_str = ", ".join(f"'{view}'" for view in expected_views)
             pg_schema = os.getenv("DATABASE_SCHEMA", "public")
             ret = await self.db.query_raw(
-                f"""
-                WITH existing_views AS (
-                    SELECT viewname
-                    FROM pg_views
-                    WHERE schemaname = '{pg_schema}' AND viewname IN (
-                        {expected_views_str}
-                    )
-                )
-                SELECT
-                    (SELECT COUNT(*) FROM existing_views) AS view_count,
-                    ARRAY_AGG(viewname) AS view_names
-                FROM existing_views
-                """
+                _CHECK_VIEWS_SQL_TEMPLATE.format(pg_schema=pg_schema)
             )
-            expected_total_views = len(expected_views)
+            expected_total_views = len(_EXPECTED_VIEWS)
             if ret[0]["view_count"] == expected_total_views:
                 verbose_proxy_logger.info("All necessary views exist!")
                 return
@@ -1376,13 +1765,9 @@ class PrismaClient:
                         await create_missing_views(db=self.db)
                     else:
                         # don't block execution if these views are missing
-                        # Convert lists to sets for efficient difference calculation
-                        ret_view_names_set = (
-                            set(ret[0]["view_names"]) if ret[0]["view_names"] else set()
+                        missing_views = _EXPECTED_VIEWS_SET.difference(
+                            ret[0]["view_names"] or ()
                         )
-                        expected_views_set = set(expected_views)
-                        # Find missing views
-                        missing_views = expected_views_set - ret_view_names_set
 
                         verbose_proxy_logger.warning(
                             "\n\n\033[93mNot all views exist in db, needed for UI 'Usage' tab. Missing={}.\nRun 'create_views.py' from https://github.com/BerriAI/litellm/tree/main/db_scripts to create missing views.\033[0m\n".format(
@@ -1411,45 +1796,44 @@ class PrismaClient:
         """
         Generic implementation of get data
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
-            if table_name == "users":
-                response = await self.db.litellm_usertable.find_first(
-                    where={key: value}  # type: ignore
-                )
-            elif table_name == "keys":
-                response = await self.db.litellm_verificationtoken.find_first(  # type: ignore
-                    where={key: value}  # type: ignore
-                )
-            elif table_name == "config":
-                response = await self.db.litellm_config.find_first(  # type: ignore
-                    where={key: value}  # type: ignore
-                )
-            elif table_name == "spend":
-                response = await self.db.l.find_first(  # type: ignore
-                    where={key: value}  # type: ignore
-                )
+            # resolve the model off self.db per call - PrismaWrapper may recreate the client
+            model = getattr(self.db, _GENERIC_DATA_TABLE_TO_MODEL[table_name])
+            response = await model.find_first(where={key: value})  # type: ignore
             return response
         except Exception as e:
-            import traceback
-
             error_msg = f"LiteLLM Prisma Client Exception get_generic_data: {str(e)}"
             verbose_proxy_logger.error(error_msg)
-            error_msg = error_msg + "\nException Type: {}".format(type(e))
-            error_traceback = error_msg + "\n" + traceback.format_exc()
-            end_time = time.time()
-            _duration = end_time - start_time
-            asyncio.create_task(
-                self.proxy_logging_obj.failure_handler(
-                    original_exception=e,
-                    duration=_duration,
-                    traceback_str=error_traceback,
-                    call_type="get_generic_data",
+            error_traceback = ""
+            # only used by the db_exceptions alert in failure_handler
+            if self.proxy_logging_obj.is_alert_type_enabled(AlertType.db_exceptions):
+                error_traceback = (
+                    f"{error_msg}\nException Type: {type(e)}\n{traceback.format_exc()}"
                 )
+            end_time = time.perf_counter()
+            _duration = end_time - start_time
+            self.proxy_logging_obj.log_db_failure(
+                original_exception=e,
+                duration=_duration,
+                traceback_str=error_traceback,
+                call_type="get_generic_data",
             )
 
             raise e
 
+    async def _find_many_verification_tokens(self, **find_many_kwargs) -> list:
+        """
+        `litellm_verificationtoken.find_many`, with `expires` cast to an isoformat str for prisma
+        """
+        response = await self.db.litellm_verificationtoken.find_many(
+            **find_many_kwargs  # type: ignore
+        )
+        if response:
+            for r in response:
+                _cast_expires_to_isoformat(r)
+        return response
+
     @backoff.on_exception(
         backoff.expo,
         Exception,  # base exception to catch for the backoff
@@ -1489,21 +1873,27 @@ class PrismaClient:
         parent_otel_span: Optional[Span] = None,
         proxy_logging_obj: Optional[ProxyLogging] = None,
         budget_id_list: Optional[List[str]] = None,
+        include_budget: bool = True,
     ):
-        args_passed_in = locals()
-        start_time = time.time()
+        """
+        include_budget: join `litellm_budget_table` onto key rows. Set to False when the caller doesn't read it.
+        """
+        start_time = time.perf_counter()
         hashed_token: Optional[str] = None
         try:
             response: Any = None
             if (token is not None and table_name is None) or (
                 table_name is not None and table_name == "key"
             ):
+                key_include: Optional[dict] = (
+                    {"litellm_budget_table": True} if include_budget else None
+                )
                 # check if plain text or hash
                 if token is not None:
                     if isinstance(token, str):
                         hashed_token = _hash_token_if_needed(token=token)
                         verbose_proxy_logger.debug(
-                            f"PrismaClient: find_unique for token: {hashed_token}"
+                            "PrismaClient: find_unique for token: %s", hashed_token
                         )
                 if query_type == "find_unique" and hashed_token is not None:
                     if token is None:
@@ -1513,14 +1903,10 @@ class PrismaClient:
                         )
                     response = await self.db.litellm_verificationtoken.find_unique(
                         where={"token": hashed_token},  # type: ignore
-                        include={"litellm_budget_table": True},
+                        include=key_include,  # type: ignore
                     )
                     if response is not None:
-                        # for prisma we need to cast the expires time to str
-                        if response.expires is not None and isinstance(
-                            response.expires, datetime
-                        ):
-                            response.expires = response.expires.isoformat()
+                        _cast_expires_to_isoformat(response)
                     else:
                         # Token does not exist.
                         raise HTTPException(
@@ -1528,30 +1914,22 @@ class PrismaClient:
                             detail=f"Authentication Error: invalid user key - user key does not exist in db. User Key={token}",
                         )
                 elif query_type == "find_all" and user_id is not None:
-                    response = await self.db.litellm_verificationtoken.find_many(
+                    response = await self._find_many_verification_tokens(
                         where={"user_id": user_id},
-                        include={"litellm_budget_table": True},
+                        include=key_include,  # type: ignore
                     )
-                    if response is not None and len(response) > 0:
-                        for r in response:
-                            if isinstance(r.expires, datetime):
-                                r.expires = r.expires.isoformat()
                 elif query_type == "find_all" and team_id is not None:
-                    response = await self.db.litellm_verificationtoken.find_many(
+                    response = await self._find_many_verification_tokens(
                         where={"team_id": team_id},
-                        include={"litellm_budget_table": True},
+                        include=key_include,  # type: ignore
                     )
-                    if response is not None and len(response) > 0:
-                        for r in response:
-                            if isinstance(r.expires, datetime):
-                                r.expires = r.expires.isoformat()
                 elif (
                     query_type == "find_all"
                     and expires is not None
                     and reset_at is not None
                 ):
-                    response = await self.db.litellm_verificationtoken.find_many(
-                        where={  # type:ignore
+                    response = await self._find_many_verification_tokens(
+                        where={
                             "OR": [
                                 {"expires": None},
                                 {"expires": {"gt": expires}},
@@ -1559,10 +1937,6 @@ class PrismaClient:
                             "budget_reset_at": {"lt": reset_at},
                         }
                     )
-                    if response is not None and len(response) > 0:
-                        for r in response:
-                            if isinstance(r.expires, datetime):
-                                r.expires = r.expires.isoformat()
                 elif query_type == "find_all":
                     where_filter: dict = {}
                     if token is not None:
@@ -1571,20 +1945,19 @@ class PrismaClient:
                             token = _hash_token_if_needed(token=token)
                             where_filter["token"]["in"] = [token]
                         elif isinstance(token, list):
-                            hashed_tokens = []
-                            for t in token:
-                                assert isinstance(t, str)
-                                if t.startswith("sk-"):
-                                    new_token = self.hash_token(token=t)
-                                    hashed_tokens.append(new_token)
-                                else:
-                                    hashed_tokens.append(t)
-                            where_filter["token"]["in"] = hashed_tokens
-                    response = await self.db.litellm_verificationtoken.find_many(
-                        order={"spend": "desc"},
-                        where=where_filter,  # type: ignore
-                        include={"litellm_budget_table": True},
-                    )
+                            # dedupe - raw and pre-hashed forms of a key hash to the same value
+                            where_filter["token"]["in"] = list(
+                                dict.fromkeys(_hash_tokens_if_needed(tokens=token))
+                            )
+                    if token is not None and not where_filter["token"].get("in"):
+                        # `IN ()` can never match
+                        response = []
+                    else:
+                        response = await self.db.litellm_verificationtoken.find_many(
+                            order={"spend": "desc"},
+                            where=where_filter,  # type: ignore
+                            include=key_include,  # type: ignore
+                        )
                 if response is not None:
                     return response
                 else:
@@ -1632,20 +2005,9 @@ class PrismaClient:
                         )
                     else:
                         # return all users in the table, get their key aliases ordered by spend
-                        sql_query = """
-                        SELECT
-                            u.*,
-                            json_agg(v.key_alias) AS key_aliases
-                        FROM
-                            "LiteLLM_UserTable" u
-                        LEFT JOIN "LiteLLM_VerificationToken" v ON u.user_id = v.user_id
-                        GROUP BY
-                            u.user_id
-                        ORDER BY u.spend DESC
-                        LIMIT $1
-                        OFFSET $2
-                        """
-                        response = await self.db.query_raw(sql_query, limit, offset)
+                        response = await self.db.query_raw(
+                            _USER_LIST_WITH_KEY_ALIASES_SQL, limit, offset
+                        )
                 return response
             elif table_name == "spend":
                 verbose_proxy_logger.debug(
@@ -1735,7 +2097,7 @@ class PrismaClient:
                     if isinstance(token, str):
                         hashed_token = _hash_token_if_needed(token=token)
                         verbose_proxy_logger.debug(
-                            f"PrismaClient: find_unique for token: {hashed_token}"
+                            "PrismaClient: find_unique for token: %s", hashed_token
                         )
                 if query_type == "find_unique":
                     if token is None:
@@ -1744,107 +2106,70 @@ class PrismaClient:
                             detail={"error": f"No token passed in. Token={token}"},
                         )
 
-                    sql_query = f"""
-                        SELECT 
-                            v.*,
-                            t.spend AS team_spend, 
-                            t.max_budget AS team_max_budget, 
-                            t.tpm_limit AS team_tpm_limit,
-                            t.rpm_limit AS team_rpm_limit,
-                            t.models AS team_models,
-                            t.metadata AS team_metadata,
-                            t.blocked AS team_blocked,
-                            t.team_alias AS team_alias,
-                            t.metadata AS team_metadata,
-                            t.members_with_roles AS team_members_with_roles,
-                            t.organization_id as org_id,
-                            tm.spend AS team_member_spend,
-                            m.aliases AS team_model_aliases,
-                            -- Added comma to separate b.* columns
-                            b.max_budget AS litellm_budget_table_max_budget,
-                            b.tpm_limit AS litellm_budget_table_tpm_limit,
-                            b.rpm_limit AS litellm_budget_table_rpm_limit,
-                            b.model_max_budget as litellm_budget_table_model_max_budget,
-                            b.soft_budget as litellm_budget_table_soft_budget
-                        FROM "LiteLLM_VerificationToken" AS v
-                        LEFT JOIN "LiteLLM_TeamTable" AS t ON v.team_id = t.team_id
-                        LEFT JOIN "LiteLLM_TeamMembership" AS tm ON v.team_id = tm.team_id AND tm.user_id = v.user_id
-                        LEFT JOIN "LiteLLM_ModelTable" m ON t.model_id = m.id
-                        LEFT JOIN "LiteLLM_BudgetTable" AS b ON v.budget_id = b.budget_id
-                        WHERE v.token = '{token}'
-                    """
-
-                    response = await self.db.query_first(query=sql_query)
+                    response = await self.db.query_first(
+                        _COMBINED_VIEW_SQL, token
+                    )
 
                     if response is not None:
-                        if response["team_models"] is None:
-                            response["team_models"] = []
-                        if response["team_blocked"] is None:
-                            response["team_blocked"] = False
-
-                        team_member: Optional[Member] = None
-                        if (
-                            response["team_members_with_roles"] is not None
-                            and response["user_id"] is not None
-                        ):
-                            ## find the team member corresponding to user id
-                            """
-                            [
-                                {
-                                    "role": "admin",
-                                    "user_id": "default_user_id",
-                                    "user_email": null
-                                },
-                                {
-                                    "role": "user",
-                                    "user_id": null,
-                                    "user_email": "test@email.com"
-                                }
-                            ]
-                            """
-                            for tm in response["team_members_with_roles"]:
-                                if tm.get("user_id") is not None and response[
-                                    "user_id"
-                                ] == tm.get("user_id"):
-                                    team_member = Member(**tm)
-                        response["team_member"] = team_member
-                        response = LiteLLM_VerificationTokenView(
-                            **response, last_refreshed_at=time.time()
-                        )
-                        # for prisma we need to cast the expires time to str
-                        if response.expires is not None and isinstance(
-                            response.expires, datetime
-                        ):
-                            response.expires = response.expires.isoformat()
+                        response = _build_token_view(response)
                     return response
         except Exception as e:
-            import traceback
-
+            # only built on the error path
+            args_passed_in = {
+                "token": token,
+                "user_id": user_id,
+                "user_id_list": user_id_list,
+                "team_id": team_id,
+                "team_id_list": team_id_list,
+                "key_val": key_val,
+                "table_name": table_name,
+                "query_type": query_type,
+                "expires": expires,
+                "reset_at": reset_at,
+                "offset": offset,
+                "limit": limit,
+                "budget_id_list": budget_id_list,
+            }
             prisma_query_info = f"LiteLLM Prisma Client Exception: Error with `get_data`. Args passed in: {args_passed_in}"
             error_msg = prisma_query_info + str(e)
             print_verbose(error_msg)
             error_traceback = error_msg + "\n" + traceback.format_exc()
             verbose_proxy_logger.debug(error_traceback)
-            end_time = time.time()
+            end_time = time.perf_counter()
             _duration = end_time - start_time
 
-            asyncio.create_task(
-                self.proxy_logging_obj.failure_handler(
-                    original_exception=e,
-                    duration=_duration,
-                    call_type="get_data",
-                    traceback_str=error_traceback,
-                )
+            self.proxy_logging_obj.log_db_failure(
+                original_exception=e,
+                duration=_duration,
+                call_type="get_data",
+                traceback_str=error_traceback,
             )
             raise e
 
+    def _dump_row_for_db(self, row: Any) -> dict:
+        """
+        Dump a pydantic row (exclude_none) to a jsonified dict for the Prisma batch upsert
+        """
+        return self.jsonify_object(data=_model_dump(row, exclude_none=True))
+
+    async def _batch_upsert(self, table: str, key_col: str, rows: List[dict]):
+        """
+        Upsert `rows` into `table` (matched on `key_col`) in a single batched transaction
+        """
+        batcher = self.db.batch_()
+        table_batcher = getattr(batcher, table)
+        for row in rows:
+            table_batcher.upsert(
+                where={key_col: row.get(key_col)},  # type: ignore
+                data={
+                    "create": row,  # type: ignore
+                    "update": row,  # type: ignore  # just update user-specified values, if it already exists
+                },
+            )
+        await batcher.commit()
+
     def jsonify_team_object(self, db_data: dict):
-        db_data = self.jsonify_object(data=db_data)
-        if db_data.get("members_with_roles", None) is not None and isinstance(
-            db_data["members_with_roles"], list
-        ):
-            db_data["members_with_roles"] = json.dumps(db_data["members_with_roles"])
-        return db_data
+        return jsonify_object(db_data, json_list_keys=("members_with_roles",))
 
     # Define a retrying strategy with exponential backoff
     @backoff.on_exception(
@@ -1864,7 +2189,7 @@ class PrismaClient:
         """
         Add a key to the database. If it already exists, do nothing.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             verbose_proxy_logger.debug("PrismaClient: insert_data: %s", data)
             if table_name == "key":
@@ -1880,7 +2205,7 @@ class PrismaClient:
                         "token": hashed_token,
                     },
                     data={
-                        "create": {**db_data},  # type: ignore
+                        "create": db_data,  # type: ignore
                         "update": {},  # don't do anything if it already exists
                     },
                     include={"litellm_budget_table": True},
@@ -1893,7 +2218,7 @@ class PrismaClient:
                     new_user_row = await self.db.litellm_usertable.upsert(
                         where={"user_id": data["user_id"]},
                         data={
-                            "create": {**db_data},  # type: ignore
+                            "create": db_data,  # type: ignore
                             "update": {},  # don't do anything if it already exists
                         },
                     )
@@ -1916,7 +2241,7 @@ class PrismaClient:
                 new_team_row = await self.db.litellm_teamtable.upsert(
                     where={"team_id": data["team_id"]},
                     data={
-                        "create": {**db_data},  # type: ignore
+                        "create": db_data,  # type: ignore
                         "update": {},  # don't do anything if it already exists
                     },
                 )
@@ -1931,27 +2256,30 @@ class PrismaClient:
 
                 Update DB
                 """
-                tasks = []
-                for k, v in data.items():
-                    updated_data = v
-                    updated_data = json.dumps(updated_data)
-                    updated_table_row = self.db.litellm_config.upsert(
-                        where={"param_name": k},  # type: ignore
-                        data={
-                            "create": {"param_name": k, "param_value": updated_data},  # type: ignore
-                            "update": {"param_value": updated_data},
-                        },
+                if data:
+                    # single statement for all params, instead of 1 upsert per param
+                    values_sql = ", ".join(
+                        f"(${2 * i + 1}, ${2 * i + 2}::jsonb)" for i in range(len(data))
+                    )
+                    params: List[Any] = []
+                    for k, v in data.items():
+                        params.extend((k, _orjson_dumps(v).decode()))
+                    await self.db.execute_raw(
+                        f"""
+                        INSERT INTO "LiteLLM_Config" (param_name, param_value)
+                        VALUES {values_sql}
+                        ON CONFLICT (param_name)
+                        DO UPDATE SET param_value = EXCLUDED.param_value
+                        """,
+                        *params,
                     )
-
-                    tasks.append(updated_table_row)
-                await asyncio.gather(*tasks)
                 verbose_proxy_logger.info("Data Inserted into Config Table")
             elif table_name == "spend":
                 db_data = self.jsonify_object(data=data)
                 new_spend_row = await self.db.litellm_spendlogs.upsert(
                     where={"request_id": data["request_id"]},
                     data={
-                        "create": {**db_data},  # type: ignore
+                        "create": db_data,  # type: ignore
                         "update": {},  # don't do anything if it already exists
                     },
                 )
@@ -1963,7 +2291,7 @@ class PrismaClient:
                     await self.db.litellm_usernotifications.upsert(  # type: ignore
                         where={"request_id": data["request_id"]},
                         data={
-                            "create": {**db_data},  # type: ignore
+                            "create": db_data,  # type: ignore
                             "update": {},  # don't do anything if it already exists
                         },
                     )
@@ -1972,20 +2300,16 @@ class PrismaClient:
                 return new_user_notification_row
 
         except Exception as e:
-            import traceback
-
             error_msg = f"LiteLLM Prisma Client Exception in insert_data: {str(e)}"
             print_verbose(error_msg)
             error_traceback = error_msg + "\n" + traceback.format_exc()
-            end_time = time.time()
+            end_time = time.perf_counter()
             _duration = end_time - start_time
-            asyncio.create_task(
-                self.proxy_logging_obj.failure_handler(
-                    original_exception=e,
-                    duration=_duration,
-                    call_type="insert_data",
-                    traceback_str=error_traceback,
-                )
+            self.proxy_logging_obj.log_db_failure(
+                original_exception=e,
+                duration=_duration,
+                call_type="insert_data",
+                traceback_str=error_traceback,
             )
             raise e
 
@@ -2015,9 +2339,9 @@ class PrismaClient:
         Update existing data
         """
         verbose_proxy_logger.debug(
-            f"PrismaClient: update_data, table_name: {table_name}"
+            "PrismaClient: update_data, table_name: %s", table_name
         )
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             db_data = self.jsonify_object(data=data)
             if update_key_values is not None:
@@ -2029,19 +2353,14 @@ class PrismaClient:
                 db_data["token"] = token
                 response = await self.db.litellm_verificationtoken.update(
                     where={"token": token},  # type: ignore
-                    data={**db_data},  # type: ignore
+                    data=db_data,  # type: ignore
                 )
                 verbose_proxy_logger.debug(
-                    "\033[91m"
-                    + f"DB Token Table update succeeded {response}"
-                    + "\033[0m"
+                    "\033[91mDB Token Table update succeeded %s\033[0m", response
                 )
                 _data: dict = {}
                 if response is not None:
-                    try:
-                        _data = response.model_dump()  # type: ignore
-                    except Exception:
-                        _data = response.dict()
+                    _data = _model_dump(response)
                 return {"token": token, "data": _data}
             elif (
                 user_id is not None
@@ -2061,16 +2380,13 @@ class PrismaClient:
                 update_user_row = await self.db.litellm_usertable.upsert(
                     where={"user_id": user_id},  # type: ignore
                     data={
-                        "create": {**db_data},  # type: ignore
-                        "update": {
-                            **update_key_values  # type: ignore
-                        },  # just update user-specified values, if it already exists
+                        "create": db_data,  # type: ignore
+                        "update": update_key_values,  # type: ignore  # just update user-specified values, if it already exists
                     },
                 )
                 verbose_proxy_logger.info(
-                    "\033[91m"
-                    + f"DB User Table - update succeeded {update_user_row}"
-                    + "\033[0m"
+                    "\033[91mDB User Table - update succeeded %s\033[0m",
+                    update_user_row,
                 )
                 return {"user_id": user_id, "data": update_user_row}
             elif (
@@ -2090,28 +2406,25 @@ class PrismaClient:
                 if "members_with_roles" in db_data and isinstance(
                     db_data["members_with_roles"], list
                 ):
-                    db_data["members_with_roles"] = json.dumps(
+                    db_data["members_with_roles"] = _orjson_dumps(
                         db_data["members_with_roles"]
-                    )
+                    ).decode()
                 if "members_with_roles" in update_key_values and isinstance(
                     update_key_values["members_with_roles"], list
                 ):
-                    update_key_values["members_with_roles"] = json.dumps(
+                    update_key_values["members_with_roles"] = _orjson_dumps(
                         update_key_values["members_with_roles"]
-                    )
+                    ).decode()
                 update_team_row = await self.db.litellm_teamtable.upsert(
                     where={"team_id": team_id},  # type: ignore
                     data={
-                        "create": {**db_data},  # type: ignore
-                        "update": {
-                            **update_key_values  # type: ignore
-                        },  # just update user-specified values, if it already exists
+                        "create": db_data,  # type: ignore
+                        "update": update_key_values,  # type: ignore  # just update user-specified values, if it already exists
                     },
                 )
                 verbose_proxy_logger.info(
-                    "\033[91m"
-                    + f"DB Team Table - update succeeded {update_team_row}"
-                    + "\033[0m"
+                    "\033[91mDB Team Table - update succeeded %s\033[0m",
+                    update_team_row,
                 )
                 return {"team_id": team_id, "data": update_team_row}
             elif (
@@ -2125,19 +2438,18 @@ class PrismaClient:
                 Batch write update queries
                 """
                 batcher = self.db.batch_()
-                for idx, t in enumerate(data_list):
-                    # check if plain text or hash
-                    if t.token.startswith("sk-"):  # type: ignore
-                        t.token = self.hash_token(token=t.token)  # type: ignore
-                    try:
-                        data_json = self.jsonify_object(
-                            data=t.model_dump(exclude_none=True)
-                        )
-                    except Exception:
-                        data_json = self.jsonify_object(data=t.dict(exclude_none=True))
+                # check if plain text or hash
+                hashed_tokens = _hash_tokens_if_needed(
+                    tokens=[t.token for t in data_list]  # type: ignore
+                )
+                for t, hashed_token in zip(data_list, hashed_tokens):
+                    t.token = hashed_token  # type: ignore
+                    data_json = self.jsonify_object(
+                        data=_model_dump(t, exclude_none=True)
+                    )
                     batcher.litellm_verificationtoken.update(
                         where={"token": t.token},  # type: ignore
-                        data={**data_json},  # type: ignore
+                        data=data_json,  # type: ignore
                     )
                 await batcher.commit()
                 print_verbose(
@@ -2153,24 +2465,11 @@ class PrismaClient:
                 """
                 Batch write update queries
                 """
-                batcher = self.db.batch_()
-                for idx, user in enumerate(data_list):
-                    try:
-                        data_json = self.jsonify_object(
-                            data=user.model_dump(exclude_none=True)
-                        )
-                    except Exception:
-                        data_json = self.jsonify_object(data=user.dict())
-                    batcher.litellm_usertable.upsert(
-                        where={"user_id": user.user_id},  # type: ignore
-                        data={
-                            "create": {**data_json},  # type: ignore
-                            "update": {
-                                **data_json  # type: ignore
-                            },  # just update user-specified values, if it already exists
-                        },
-                    )
-                await batcher.commit()
+                await self._batch_upsert(
+                    table="litellm_usertable",
+                    key_col="user_id",
+                    rows=[self._dump_row_for_db(user) for user in data_list],
+                )
                 verbose_proxy_logger.info(
                     "\033[91m" + "DB User Table Batch update succeeded" + "\033[0m"
                 )
@@ -2184,24 +2483,11 @@ class PrismaClient:
                 """
                 Batch write update queries
                 """
-                batcher = self.db.batch_()
-                for enduser in data_list:
-                    try:
-                        data_json = self.jsonify_object(
-                            data=enduser.model_dump(exclude_none=True)
-                        )
-                    except Exception:
-                        data_json = self.jsonify_object(data=enduser.dict())
-                    batcher.litellm_endusertable.upsert(
-                        where={"user_id": enduser.user_id},  # type: ignore
-                        data={
-                            "create": {**data_json},  # type: ignore
-                            "update": {
-                                **data_json  # type: ignore
-                            },  # just update end-user-specified values, if it already exists
-                        },
-                    )
-                await batcher.commit()
+                await self._batch_upsert(
+                    table="litellm_endusertable",
+                    key_col="user_id",
+                    rows=[self._dump_row_for_db(enduser) for enduser in data_list],
+                )
                 verbose_proxy_logger.info(
                     "\033[91m" + "DB End User Table Batch update succeeded" + "\033[0m"
                 )
@@ -2215,24 +2501,11 @@ class PrismaClient:
                 """
                 Batch write update queries
                 """
-                batcher = self.db.batch_()
-                for budget in data_list:
-                    try:
-                        data_json = self.jsonify_object(
-                            data=budget.model_dump(exclude_none=True)
-                        )
-                    except Exception:
-                        data_json = self.jsonify_object(data=budget.dict())
-                    batcher.litellm_budgettable.upsert(
-                        where={"budget_id": budget.budget_id},  # type: ignore
-                        data={
-                            "create": {**data_json},  # type: ignore
-                            "update": {
-                                **data_json  # type: ignore
-                            },  # just update end-user-specified values, if it already exists
-                        },
-                    )
-                await batcher.commit()
+                await self._batch_upsert(
+                    table="litellm_budgettable",
+                    key_col="budget_id",
+                    rows=[self._dump_row_for_db(budget) for budget in data_list],
+                )
                 verbose_proxy_logger.info(
                     "\033[91m" + "DB Budget Table Batch update succeeded" + "\033[0m"
                 )
@@ -2244,45 +2517,30 @@ class PrismaClient:
                 and isinstance(data_list, list)
             ):
                 # Batch write update queries
-                batcher = self.db.batch_()
-                for idx, team in enumerate(data_list):
-                    try:
-                        data_json = self.jsonify_team_object(
-                            db_data=team.model_dump(exclude_none=True)
-                        )
-                    except Exception:
-                        data_json = self.jsonify_object(
-                            data=team.dict(exclude_none=True)
-                        )
-                    batcher.litellm_teamtable.upsert(
-                        where={"team_id": team.team_id},  # type: ignore
-                        data={
-                            "create": {**data_json},  # type: ignore
-                            "update": {
-                                **data_json  # type: ignore
-                            },  # just update user-specified values, if it already exists
-                        },
+                rows = [
+                    self.jsonify_team_object(
+                        db_data=_model_dump(team, exclude_none=True)
                     )
-                await batcher.commit()
+                    for team in data_list
+                ]
+                await self._batch_upsert(
+                    table="litellm_teamtable", key_col="team_id", rows=rows
+                )
                 verbose_proxy_logger.info(
                     "\033[91m" + "DB Team Table Batch update succeeded" + "\033[0m"
                 )
 
         except Exception as e:
-            import traceback
-
             error_msg = f"LiteLLM Prisma Client Exception - update_data: {str(e)}"
             print_verbose(error_msg)
             error_traceback = error_msg + "\n" + traceback.format_exc()
-            end_time = time.time()
+            end_time = time.perf_counter()
             _duration = end_time - start_time
-            asyncio.create_task(
-                self.proxy_logging_obj.failure_handler(
-                    original_exception=e,
-                    duration=_duration,
-                    call_type="update_data",
-                    traceback_str=error_traceback,
-                )
+            self.proxy_logging_obj.log_db_failure(
+                original_exception=e,
+                duration=_duration,
+                call_type="update_data",
+                traceback_str=error_traceback,
             )
             raise e
 
@@ -2306,16 +2564,18 @@ class PrismaClient:
 
         Ensure user owns that key, unless admin.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             if tokens is not None and isinstance(tokens, List):
-                hashed_tokens = []
-                for token in tokens:
-                    if isinstance(token, str) and token.startswith("sk-"):
-                        hashed_token = self.hash_token(token=token)
-                    else:
-                        hashed_token = token
-                    hashed_tokens.append(hashed_token)
+                # dedupe inputs (skips repeat hashing) and outputs (raw + hashed forms of a key)
+                hashed_tokens = list(
+                    dict.fromkeys(
+                        _hash_token_if_needed(token=token)
+                        if isinstance(token, str)
+                        else token
+                        for token in dict.fromkeys(tokens)
+                    )
+                )
                 filter_query: dict = {}
                 if user_id is not None:
                     filter_query = {
@@ -2349,20 +2609,16 @@ class PrismaClient:
                     where={"team_id": {"in": team_id_list}}
                 )
         except Exception as e:
-            import traceback
-
             error_msg = f"LiteLLM Prisma Client Exception - delete_data: {str(e)}"
             print_verbose(error_msg)
             error_traceback = error_msg + "\n" + traceback.format_exc()
-            end_time = time.time()
+            end_time = time.perf_counter()
             _duration = end_time - start_time
-            asyncio.create_task(
-                self.proxy_logging_obj.failure_handler(
-                    original_exception=e,
-                    duration=_duration,
-                    call_type="delete_data",
-                    traceback_str=error_traceback,
-                )
+            self.proxy_logging_obj.log_db_failure(
+                original_exception=e,
+                duration=_duration,
+                call_type="delete_data",
+                traceback_str=error_traceback,
             )
             raise e
 
@@ -2375,7 +2631,7 @@ class PrismaClient:
         on_backoff=on_backoff,  # specifying the function to call on backoff
     )
     async def connect(self):
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             verbose_proxy_logger.debug(
                 "PrismaClient: connect() called Attempting to Connect to DB"
@@ -2386,20 +2642,16 @@ class PrismaClient:
                 )
                 await self.db.connect()
         except Exception as e:
-            import traceback
-
             error_msg = f"LiteLLM Prisma Client Exception connect(): {str(e)}"
             print_verbose(error_msg)
             error_traceback = error_msg + "\n" + traceback.format_exc()
-            end_time = time.time()
+            end_time = time.perf_counter()
             _duration = end_time - start_time
-            asyncio.create_task(
-                self.proxy_logging_obj.failure_handler(
-                    original_exception=e,
-                    duration=_duration,
-                    call_type="connect",
-                    traceback_str=error_traceback,
-                )
+            self.proxy_logging_obj.log_db_failure(
+                original_exception=e,
+                duration=_duration,
+                call_type="connect",
+                traceback_str=error_traceback,
             )
             raise e
 
@@ -2412,24 +2664,20 @@ class PrismaClient:
         on_backoff=on_backoff,  # specifying the function to call on backoff
     )
     async def disconnect(self):
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             await self.db.disconnect()
         except Exception as e:
-            import traceback
-
             error_msg = f"LiteLLM Prisma Client Exception disconnect(): {str(e)}"
             print_verbose(error_msg)
             error_traceback = error_msg + "\n" + traceback.format_exc()
-            end_time = time.time()
+            end_time = time.perf_counter()
             _duration = end_time - start_time
-            asyncio.create_task(
-                self.proxy_logging_obj.failure_handler(
-                    original_exception=e,
-                    duration=_duration,
-                    call_type="disconnect",
-                    traceback_str=error_traceback,
-                )
+            self.proxy_logging_obj.log_db_failure(
+                original_exception=e,
+                duration=_duration,
+                call_type="disconnect",
+                traceback_str=error_traceback,
             )
             raise e
 
@@ -2437,7 +2685,7 @@ class PrismaClient:
         """
         Health check endpoint for the prisma client
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             sql_query = "SELECT 1"
 
@@ -2446,20 +2694,16 @@ class PrismaClient:
             response = await self.db.query_raw(sql_query)
             return response
         except Exception as e:
-            import traceback
-
             error_msg = f"LiteLLM Prisma Client Exception disconnect(): {str(e)}"
             print_verbose(error_msg)
             error_traceback = error_msg + "\n" + traceback.format_exc()
-            end_time = time.time()
+            end_time = time.perf_counter()
             _duration = end_time - start_time
-            asyncio.create_task(
-                self.proxy_logging_obj.failure_handler(
-                    original_exception=e,
-                    duration=_duration,
-                    call_type="health_check",
-                    traceback_str=error_traceback,
-                )
+            self.proxy_logging_obj.log_db_failure(
+                original_exception=e,
+                duration=_duration,
+                call_type="health_check",
+                traceback_str=error_traceback,
             )
             raise e
 
@@ -2501,11 +2745,7 @@ class PrismaClient:
             return None
         try:
             value = float(response_time_ms)
-            return (
-                value
-                if value == value and value not in (float("inf"), float("-inf"))
-                else None
-            )
+            return value if math.isfinite(value) else None
         except (ValueError, TypeError):
             verbose_proxy_logger.warning(
                 f"Invalid response_time_ms value: {response_time_ms}"
@@ -2517,7 +2757,8 @@ class PrismaClient:
         if not isinstance(details, dict):
             return None
         try:
-            return safe_json_loads(safe_dumps(details))
+            # sanitize in one pass, no dump + reparse round trip
+            return safe_serialize(details)
         except Exception as e:
             verbose_proxy_logger.warning(f"Failed to clean details JSON: {e}")
             return None
@@ -2544,19 +2785,19 @@ class PrismaClient:
                 "unhealthy_count": int(unhealthy_count),
             }
 
-            # Add optional fields using dict comprehension and helper methods
-            optional_fields = {
-                "error_message": str(error_message)[:500] if error_message else None,
-                "response_time_ms": self._validate_response_time(response_time_ms),
-                "details": self._clean_details(details),
-                "checked_by": str(checked_by) if checked_by else None,
-                "model_id": str(model_id) if model_id else None,
-            }
-
             # Add only non-None optional fields
-            health_check_data.update(
-                {k: v for k, v in optional_fields.items() if v is not None}
-            )
+            if error_message:
+                health_check_data["error_message"] = str(error_message)[:500]
+            validated_response_time = self._validate_response_time(response_time_ms)
+            if validated_response_time is not None:
+                health_check_data["response_time_ms"] = validated_response_time
+            cleaned_details = self._clean_details(details)
+            if cleaned_details is not None:
+                health_check_data["details"] = cleaned_details
+            if checked_by:
+                health_check_data["checked_by"] = str(checked_by)
+            if model_id:
+                health_check_data["model_id"] = str(model_id)
 
             verbose_proxy_logger.debug(f"Saving health check data: {health_check_data}")
             return await self.db.litellm_healthchecktable.create(data=health_check_data)
@@ -2600,18 +2841,10 @@ class PrismaClient:
         Get the latest health check for each model
         """
         try:
-            # Get all unique model names first
-            all_checks = await self.db.litellm_healthchecktable.find_many(
-                order={"checked_at": "desc"}
+            # postgres returns one row per model, instead of the whole check history
+            return await self.db.query_raw(
+                _LATEST_HEALTH_CHECKS_SQL, model=_get_health_check_model()
             )
-
-            # Group by model_name and get the latest for each
-            latest_checks = {}
-            for check in all_checks:
-                if check.model_name not in latest_checks:
-                    latest_checks[check.model_name] = check
-
-            return list(latest_checks.values())
         except Exception as e:
             verbose_proxy_logger.error(f"Error getting all latest health checks: {e}")
             return []
@@ -2626,16 +2859,19 @@ async def _cache_user_row(user_id: str, cache: DualCache, db: PrismaClient):
     if not retrieve it.
     """
     cache_key = f"{user_id}_user_api_key_user_id"
-    response = cache.get_cache(key=cache_key)
+    response = await cache.async_get_cache(key=cache_key)
     if response is None:  # Cache miss
         user_row = await db.get_data(user_id=user_id)
         if user_row is not None:
-            print_verbose(f"User Row: {user_row}, type = {type(user_row)}")
-            if hasattr(user_row, "model_dump_json") and callable(
-                getattr(user_row, "model_dump_json")
+            verbose_proxy_logger.debug(
+                "User Row: %s, type = %s", user_row, type(user_row)
+            )
+            if hasattr(user_row, "model_dump") and callable(
+                getattr(user_row, "model_dump")
             ):
-                cache_value = user_row.model_dump_json()
-                cache.set_cache(
+                # json-safe dict, readers get it back without re-parsing a json string
+                cache_value = user_row.model_dump(mode="json")
+                await cache.async_set_cache(
                     key=cache_key, value=cache_value, ttl=600
                 )  # store for 10 minutes
     return
@@ -2686,41 +2922,66 @@ async def send_email(
     email_message.attach(MIMEText(html, "html"))
 
     try:
-        # Establish a secure connection with the SMTP server
-        with smtplib.SMTP(
-            host=smtp_host,
-            port=smtp_port,
-        ) as server:
-            if os.getenv("SMTP_TLS", "True") != "False":
-                server.starttls()
-
-            # Login to your email account only if smtp_username and smtp_password are provided
-            if smtp_username and smtp_password:
-                server.login(
-                    user=smtp_username,
-                    password=smtp_password,
-                )
-
-            # Send the email
-            server.send_message(
-                msg=email_message,
-                from_addr=sender_email,
-                to_addrs=receiver_email,
-            )
-
+        # smtplib blocks for the whole TLS + auth + send conversation, keep it off the event loop
+        await asyncio.get_running_loop().run_in_executor(
+            executor,
+            functools.partial(
+                _send_smtp_message,
+                smtp_host=smtp_host,
+                smtp_port=smtp_port,
+                smtp_username=smtp_username,
+                smtp_password=smtp_password,
+                email_message=email_message,
+                sender_email=sender_email,
+                receiver_email=receiver_email,
+            ),
+        )
     except Exception as e:
         verbose_proxy_logger.exception(
             "An error occurred while sending the email:" + str(e)
         )
 
 
-def hash_token(token: str):
-    import hashlib
+def _send_smtp_message(
+    smtp_host: str,
+    smtp_port: int,
+    smtp_username: Optional[str],
+    smtp_password: Optional[str],
+    email_message: MIMEMultipart,
+    sender_email: str,
+    receiver_email: str,
+) -> None:
+    # Establish a secure connection with the SMTP server
+    with smtplib.SMTP(
+        host=smtp_host,
+        port=smtp_port,
+    ) as server:
+        if os.getenv("SMTP_TLS", "True") != "False":
+            server.starttls()
+
+        # Login to your email account only if smtp_username and smtp_password are provided
+        if smtp_username and smtp_password:
+            server.login(
+                user=smtp_username,
+                password=smtp_password,
+            )
+
+        # Send the email
+        server.send_message(
+            msg=email_message,
+            from_addr=sender_email,
+            to_addrs=receiver_email,
+        )
 
-    # Hash the string using SHA-256
-    hashed_token = hashlib.sha256(token.encode()).hexdigest()
 
-    return hashed_token
+@functools.lru_cache(maxsize=65536)
+def _sha256_hex(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def hash_token(token: str):
+    # Hash the string using SHA-256, cached since the same keys are hashed on every request
+    return _sha256_hex(token)
 
 
 def _hash_token_if_needed(token: str) -> str:
@@ -2729,10 +2990,17 @@ def _hash_token_if_needed(token: str) -> str:
 
     Else return the token as is
     """
-    if token.startswith("sk-"):
-        return hash_token(token=token)
-    else:
-        return token
+    return _sha256_hex(token) if token.startswith("sk-") else token
+
+
+def _hash_tokens_if_needed(tokens: List[str]) -> List[str]:
+    """
+    Bulk version of `_hash_token_if_needed` - hashes every "sk-" token in one pass
+    """
+    sha256_hex = _sha256_hex
+    return [
+        sha256_hex(token) if token.startswith("sk-") else token for token in tokens
+    ]
 
 
 class ProxyUpdateSpend:
@@ -2744,7 +3012,7 @@ class ProxyUpdateSpend:
         end_user_list_transactions: Dict[str, float],
     ):
         for i in range(n_retry_times + 1):
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 async with prisma_client.db.tx(
                     timeout=timedelta(seconds=60)
@@ -2785,16 +3053,24 @@ class ProxyUpdateSpend:
     async def update_spend_logs(
         n_retry_times: int,
         prisma_client: PrismaClient,
-        db_writer_client: Optional[HTTPHandler],
+        db_writer_client: Optional[AsyncHTTPHandler],
         proxy_logging_obj: ProxyLogging,
     ):
         BATCH_SIZE = 100  # Preferred size of each batch to write to the database
         MAX_LOGS_PER_INTERVAL = (
             1000  # Maximum number of logs to flush in a single interval
         )
-        # Get initial logs to process
-        logs_to_process = prisma_client.spend_log_transactions[:MAX_LOGS_PER_INTERVAL]
-        start_time = time.time()
+        # Detach the batch up front by swapping in a fresh buffer holding only the
+        # overflow. Nothing awaits between the read and the swap, so concurrent
+        # appends land in the new list and no caller sees the old one change mid-flush.
+        pending_logs = prisma_client.spend_log_transactions
+        logs_to_process = pending_logs[:MAX_LOGS_PER_INTERVAL]
+        prisma_client.spend_log_transactions = pending_logs[MAX_LOGS_PER_INTERVAL:]
+        # jsonified batches are built once and reused across retries
+        batches_with_dates: Optional[List[List[dict]]] = None
+        # retries resume from the first batch that wasn't written
+        flushed_batches = 0
+        start_time = time.perf_counter()
         try:
             for i in range(n_retry_times + 1):
                 try:
@@ -2809,32 +3085,33 @@ class ProxyUpdateSpend:
                         verbose_proxy_logger.debug("base_url: {}".format(base_url))
                         response = await db_writer_client.post(
                             url=base_url + "spend/update",
-                            data=json.dumps(logs_to_process),
+                            content=_orjson_dumps(logs_to_process),
                             headers={"Content-Type": "application/json"},
                         )
-                        if response.status_code == 200:
+                        if response.status_code != 200:
+                            # keep the batch queued for the next flush
                             prisma_client.spend_log_transactions = (
-                                prisma_client.spend_log_transactions[
-                                    len(logs_to_process) :
-                                ]
+                                logs_to_process + prisma_client.spend_log_transactions
                             )
                     else:
-                        for j in range(0, len(logs_to_process), BATCH_SIZE):
-                            batch = logs_to_process[j : j + BATCH_SIZE]
-                            batch_with_dates = [
-                                prisma_client.jsonify_object({**entry})
-                                for entry in batch
+                        if batches_with_dates is None:
+                            jsonified_logs = list(
+                                map(prisma_client.jsonify_object, logs_to_process)
+                            )
+                            batches_with_dates = [
+                                jsonified_logs[j : j + BATCH_SIZE]
+                                for j in range(0, len(jsonified_logs), BATCH_SIZE)
                             ]
+                        while flushed_batches < len(batches_with_dates):
+                            batch_with_dates = batches_with_dates[flushed_batches]
                             await prisma_client.db.litellm_spendlogs.create_many(
                                 data=batch_with_dates, skip_duplicates=True
                             )
+                            flushed_batches += 1
                             verbose_proxy_logger.debug(
-                                f"Flushed {len(batch)} logs to the DB."
+                                f"Flushed {len(batch_with_dates)} logs to the DB."
                             )
 
-                        prisma_client.spend_log_transactions = (
-                            prisma_client.spend_log_transactions[len(logs_to_process) :]
-                        )
                         verbose_proxy_logger.debug(
                             f"{len(logs_to_process)} logs processed. Remaining in queue: {len(prisma_client.spend_log_transactions)}"
                         )
@@ -2846,9 +3123,6 @@ class ProxyUpdateSpend:
                         raise
                     await asyncio.sleep(2**i)
         except Exception as e:
-            prisma_client.spend_log_transactions = prisma_client.spend_log_transactions[
-                len(logs_to_process) :
-            ]
             _raise_failed_update_spend_exception(
                 e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
             )
@@ -2859,7 +3133,7 @@ class ProxyUpdateSpend:
         returns True if should not update spend in db
         Skips writing spend logs and updates to key, team, user spend to DB
         """
-        from litellm.proxy.proxy_server import general_settings
+        general_settings = _get_proxy_server_module().general_settings
 
         if general_settings.get("disable_spend_updates") is True:
             return True
@@ -2868,7 +3142,7 @@ class ProxyUpdateSpend:
 
 async def update_spend(  # noqa: PLR0915
     prisma_client: PrismaClient,
-    db_writer_client: Optional[HTTPHandler],
+    db_writer_client: Optional[AsyncHTTPHandler],
     proxy_logging_obj: ProxyLogging,
 ):
     """
@@ -2909,52 +3183,53 @@ def _raise_failed_update_spend_exception(
     """
     Raise an exception for failed update spend logs
 
-    - Calls proxy_logging_obj.failure_handler to log the error
+    - Queues proxy_logging_obj.failure_handler on the hook workers to log the error
     - Ensures error messages says "Non-Blocking"
     """
-    import traceback
-
     error_msg = (
         f"[Non-Blocking]LiteLLM Prisma Client Exception - update spend logs: {str(e)}"
     )
     error_traceback = error_msg + "\n" + traceback.format_exc()
-    end_time = time.time()
+    end_time = time.perf_counter()
     _duration = end_time - start_time
-    asyncio.create_task(
-        proxy_logging_obj.failure_handler(
-            original_exception=e,
-            duration=_duration,
-            call_type="update_spend",
-            traceback_str=error_traceback,
-        )
+    proxy_logging_obj.log_db_failure(
+        original_exception=e,
+        duration=_duration,
+        call_type="update_spend",
+        traceback_str=error_traceback,
     )
     raise e
 
 
-def _is_projected_spend_over_limit(
-    current_spend: float, soft_budget_limit: Optional[float]
-):
-    from datetime import date
-
-    if soft_budget_limit is None:
-        # If there's no limit, we can't exceed it.
-        return False
-
-    today = date.today()
+@functools.lru_cache(maxsize=1)
+def _month_bounds(today: date) -> Tuple[int, int]:
+    """
+    Return (day of month, days remaining until the end of the month) for `today`.
 
+    Cached on `today`, so it is only recomputed when the date rolls over.
+    """
     # Finding the first day of the next month, then subtracting one day to get the end of the current month.
     if today.month == 12:  # December edge case
         end_month = date(today.year + 1, 1, 1) - timedelta(days=1)
     else:
         end_month = date(today.year, today.month + 1, 1) - timedelta(days=1)
+    return today.day, (end_month - today).days
+
+
+def _is_projected_spend_over_limit(
+    current_spend: float, soft_budget_limit: Optional[float]
+):
+    if soft_budget_limit is None:
+        # If there's no limit, we can't exceed it.
+        return False
 
-    remaining_days = (end_month - today).days
+    day_of_month, remaining_days = _month_bounds(date.today())
 
     # Check for the start of the month to avoid division by zero
-    if today.day == 1:
+    if day_of_month == 1:
         daily_spend_estimate = current_spend
     else:
-        daily_spend_estimate = current_spend / (today.day - 1)
+        daily_spend_estimate = current_spend / (day_of_month - 1)
 
     # Total projected spend for the month
     projected_spend = current_spend + (daily_spend_estimate * remaining_days)
@@ -2968,25 +3243,20 @@ def _is_projected_spend_over_limit(
 def _get_projected_spend_over_limit(
     current_spend: float, soft_budget_limit: Optional[float]
 ) -> Optional[tuple]:
-    import datetime
-
     if soft_budget_limit is None:
         return None
 
-    today = datetime.date.today()
-    end_month = datetime.date(today.year, today.month + 1, 1) - datetime.timedelta(
-        days=1
-    )
-    remaining_days = (end_month - today).days
+    today = date.today()
+    day_of_month, remaining_days = _month_bounds(today)
 
     daily_spend = current_spend / (
-        today.day - 1
+        day_of_month - 1
     )  # assuming the current spend till today (not including today)
     projected_spend = daily_spend * remaining_days
 
     if projected_spend > soft_budget_limit:
         approx_days = soft_budget_limit / daily_spend
-        limit_exceed_date = today + datetime.timedelta(days=approx_days)
+        limit_exceed_date = today + timedelta(days=approx_days)
 
         # return the projected spend and the date it will exceeded
         return projected_spend, limit_exceed_date
@@ -3012,24 +3282,25 @@ def _to_ns(dt):
     return int(dt.timestamp() * 1e9)
 
 
+_MISSING = object()
+
+
 def get_error_message_str(e: Exception) -> str:
-    error_message = ""
-    if isinstance(e, HTTPException):
-        if isinstance(e.detail, str):
-            error_message = e.detail
-        elif isinstance(e.detail, dict):
-            error_message = json.dumps(e.detail)
-        elif hasattr(e, "message"):
-            _error = getattr(e, "message", None)
-            if isinstance(_error, str):
-                error_message = _error
-            elif isinstance(_error, dict):
-                error_message = json.dumps(_error)
-        else:
-            error_message = str(e)
-    else:
-        error_message = str(e)
-    return error_message
+    if not isinstance(e, HTTPException):
+        return str(e)
+    detail = e.detail
+    if isinstance(detail, str):
+        return detail
+    if isinstance(detail, dict):
+        return json.dumps(detail)
+    _error = getattr(e, "message", _MISSING)
+    if _error is _MISSING:
+        return str(e)
+    if isinstance(_error, str):
+        return _error
+    if isinstance(_error, dict):
+        return json.dumps(_error)
+    return ""
 
 
 def _get_redoc_url() -> Optional[str]:
@@ -3070,19 +3341,22 @@ def handle_exception_on_proxy(e: Exception) -> ProxyException:
     """
     Returns an Exception as ProxyException, this ensures all exceptions are OpenAI API compatible
     """
-    from fastapi import status
-
-    verbose_proxy_logger.exception(f"Exception: {e}")
-
     if isinstance(e, HTTPException):
+        # raised on purpose - skip formatting the traceback unless debugging
+        if verbose_proxy_logger.isEnabledFor(logging.DEBUG):
+            verbose_proxy_logger.debug(f"Exception: {e}", exc_info=True)
         return ProxyException(
-            message=getattr(e, "detail", f"error({str(e)})"),
+            message=e.detail,
             type=ProxyErrorTypes.internal_server_error,
             param=getattr(e, "param", "None"),
-            code=getattr(e, "status_code", status.HTTP_500_INTERNAL_SERVER_ERROR),
+            code=e.status_code,
         )
     elif isinstance(e, ProxyException):
+        if verbose_proxy_logger.isEnabledFor(logging.DEBUG):
+            verbose_proxy_logger.debug(f"Exception: {e}", exc_info=True)
         return e
+
+    verbose_proxy_logger.exception(f"Exception: {e}")
     return ProxyException(
         message="Internal Server Error, " + str(e),
         type=ProxyErrorTypes.internal_server_error,
@@ -3091,18 +3365,17 @@ def handle_exception_on_proxy(e: Exception) -> ProxyException:
     )
 
 
+_NOT_PREMIUM_USER_ERROR = f"This feature is only available for LiteLLM Enterprise users. {CommonProxyErrors.not_premium_user.value}"
+
+
 def _premium_user_check():
     """
     Raises an HTTPException if the user is not a premium user
     """
-    from litellm.proxy.proxy_server import premium_user
-
-    if not premium_user:
+    if not _get_proxy_server_module().premium_user:
         raise HTTPException(
             status_code=403,
-            detail={
-                "error": f"This feature is only available for LiteLLM Enterprise users. {CommonProxyErrors.not_premium_user.value}"
-            },
+            detail={"error": _NOT_PREMIUM_USER_ERROR},
         )
 
 
@@ -3112,16 +3385,19 @@ def is_known_model(model: Optional[str], llm_router: Optional[Router]) -> bool:
     """
     if model is None or llm_router is None:
         return False
-    model_names = llm_router.get_model_names()
-
-    is_in_list = False
-    if model in model_names:
-        is_in_list = True
-
-    return is_in_list
+    return model in llm_router.get_model_names()
 
 
 def join_paths(base_path: str, route: str) -> str:
+    # Fast path: nothing to strip on either side
+    if (
+        base_path
+        and route
+        and not base_path.endswith("/")
+        and not route.startswith("/")
+    ):
+        return f"{base_path}/{route}"
+
     # Remove trailing slashes from base_path and leading slashes from route
     base_path = base_path.rstrip("/")
     route = route.lstrip("/")
@@ -3148,6 +3424,10 @@ def get_custom_url(request_base_url: str, route: Optional[str] = None) -> str:
 
     server_root_path = get_server_root_path()
     if route is not None:
+        route = route.lstrip("/")
+        if route and (server_root_path == "/" or server_root_path == ""):
+            # common case, no root path to splice in
+            return f"{base_url.rstrip('/')}/{route}"
         if server_root_path != "":
             # First join base_url with server_root_path, then with route
             intermediate_url = join_paths(base_url, server_root_path)
@@ -3176,7 +3456,7 @@ def get_server_root_path() -> str:
 
 
 def get_prisma_client_or_throw(message: str):
-    from litellm.proxy.proxy_server import prisma_client
+    prisma_client = _get_proxy_server_module().prisma_client
 
     if prisma_client is None:
         raise HTTPException(
@@ -3186,19 +3466,28 @@ def get_prisma_client_or_throw(message: str):
     return prisma_client
 
 
+_SK_KEY_BODY_RE = re.compile(r"[A-Za-z0-9_-]+")
+
+
 def is_valid_api_key(key: str) -> bool:
     """
     Validates API key format:
     - sk- keys: must match ^sk-[A-Za-z0-9_-]+$
     - hashed keys: must match ^[a-fA-F0-9]{64}$
-    - Length between 20 and 100 characters
+    - Length between 3 and 100 characters
     """
-    import re
     if not isinstance(key, str):
         return False
-    if 3 <= len(key) <= 100:
-        if re.match(r"^sk-[A-Za-z0-9_-]+$", key):
-            return True
-        if re.match(r"^[a-fA-F0-9]{64}$", key):
-            return True
-    return False
+    n = len(key)
+    if n < 3 or n > 100:
+        return False
+    if key.startswith("sk-"):
+        # only the body after the prefix needs the regex
+        return _SK_KEY_BODY_RE.fullmatch(key, 3) is not None
+    if n != 64:
+        return False
+    try:
+        # fromhex skips whitespace, so only 64 hex chars decode to 32 bytes
+        return len(bytes.fromhex(key)) == 32
+    except ValueError:
+        return False
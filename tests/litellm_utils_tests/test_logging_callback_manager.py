@@ -277,3 +277,17 @@ async def test_slack_alerting_callback_registration(callback_manager):
 
         # Cleanup
         callback_manager._reset_all_callbacks()
+
+
+def test_add_litellm_callbacks_bulk(callback_manager, mock_custom_logger):
+    """
+    Test bulk adding callbacks - applies the same duplicate checks as add_litellm_callback
+    """
+    callback_manager.add_litellm_callbacks(
+        [mock_custom_logger, "test_callback", mock_custom_logger, "test_callback"]
+    )
+    assert litellm.callbacks == [mock_custom_logger, "test_callback"]
+
+    # existing callbacks are not re-added
+    callback_manager.add_litellm_callbacks([mock_custom_logger])
+    assert litellm.callbacks == [mock_custom_logger, "test_callback"]
@@ -130,7 +130,7 @@ async def test_update_spend_logs_max_retries_exceeded(error_type):
 
     await asyncio.sleep(2)
     # Verify failure handler was called
-    assert proxy_logging_obj.failure_handler.call_count == 1
+    assert proxy_logging_obj.log_db_failure.call_count == 1
 
 
 @pytest.mark.asyncio
@@ -161,7 +161,7 @@ async def test_update_spend_logs_non_connection_error():
     # Verify only tried once (no retries for non-connection errors)
     assert create_many_mock.call_count == 1
     # Verify failure handler was called
-    assert proxy_logging_obj.failure_handler.called
+    assert proxy_logging_obj.log_db_failure.called
 
 
 @pytest.mark.asyncio
@@ -282,7 +282,8 @@ async def test_update_spend_logs_multiple_batches_with_failure():
     await update_spend(prisma_client, None, proxy_logging_obj)
 
     # Verify
-    assert create_many_mock.call_count == 6  # 4 batches + 2 retries for failed batch
+    # 4 batches + 1 retry for the failed batch; retries resume from the failed batch
+    assert create_many_mock.call_count == 5
 
     # Verify all batches were processed
     all_processed_logs = []
@@ -292,6 +293,13 @@ async def test_update_spend_logs_multiple_batches_with_failure():
     # Verify all IDs were processed
     processed_ids = {item["id"] for item in all_processed_logs}
 
+    # only the failed batch is sent twice; finished batches are not rewritten
+    processed_id_list = [item["id"] for item in all_processed_logs]
+    duplicated_ids = {
+        log_id for log_id in processed_id_list if processed_id_list.count(log_id) > 1
+    }
+    assert duplicated_ids == {str(i) for i in range(100, 200)}
+
     # these should have ids 0-399
     print("all processed ids", sorted(processed_ids, key=int))
     expected_ids = {str(i) for i in range(400)}
@@ -299,3 +307,29 @@ async def test_update_spend_logs_multiple_batches_with_failure():
 
     # Verify all logs were cleared from transactions
     assert len(prisma_client.spend_log_transactions) == 0
+
+
+@pytest.mark.asyncio
+async def test_update_spend_logs_swaps_buffer_instead_of_mutating():
+    """
+    Flushed logs are detached by swapping in a fresh buffer, so a reference held
+    mid-flush is left untouched and logs appended during the flush stay queued.
+    """
+    prisma_client = MockPrismaClient()
+    proxy_logging_obj = create_mock_proxy_logging()
+
+    original_buffer = [{"id": str(i), "spend": 10} for i in range(3)]
+    prisma_client.spend_log_transactions = original_buffer
+
+    async def create_many_side_effect(**kwargs):
+        # a request finishing mid-flush appends to the live buffer
+        prisma_client.spend_log_transactions.append({"id": "late", "spend": 10})
+
+    prisma_client.db.litellm_spendlogs.create_many = AsyncMock(
+        side_effect=create_many_side_effect
+    )
+
+    await update_spend(prisma_client, None, proxy_logging_obj)
+
+    assert [log["id"] for log in original_buffer] == ["0", "1", "2"]
+    assert prisma_client.spend_log_transactions == [{"id": "late", "spend": 10}]
@@ -8,7 +8,7 @@ sys.path.insert(
     0, os.path.abspath("../../..")
 )  # Adds the parent directory to the system path
 
-from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
+from litellm.litellm_core_utils.safe_json_dumps import safe_dumps, safe_serialize
 
 
 def test_primitive_types():
@@ -138,3 +138,16 @@ def test_non_standard_dict_keys_complex():
 
         traceback.print_exc()
         raise e
+
+
+def test_safe_serialize_returns_json_safe_objects():
+    data = {"a": [1, {"b": object}], "tags": {"y", "x"}, 1: "non-str key"}
+    data["self"] = data
+
+    result = safe_serialize(data)
+
+    assert result["a"] == [1, {"b": str(object)}]
+    assert result["tags"] == ["x", "y"]
+    assert result["self"] == "CircularReference Detected"
+    assert 1 not in result
+    assert json.loads(safe_dumps(data)) == result
@@ -1,6 +1,6 @@
 import asyncio
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 import sys
 import os
 
@@ -87,5 +87,22 @@ async def test_save_health_check_to_db_no_client():
     assert result is None
 
 
+@pytest.mark.asyncio
+async def test_get_all_latest_health_checks_uses_distinct_on(mock_prisma):
+    """Latest check per model is picked in SQL, not by scanning the full history"""
+    health_check_model = MagicMock()
+    mock_prisma.db.query_raw = AsyncMock(return_value=[{"model_name": "test"}])
+
+    with patch(
+        "litellm.proxy.utils._get_health_check_model", return_value=health_check_model
+    ):
+        result = await mock_prisma.get_all_latest_health_checks()
+
+    assert result == [{"model_name": "test"}]
+    assert "DISTINCT ON (model_name)" in mock_prisma.db.query_raw.call_args[0][0]
+    assert mock_prisma.db.query_raw.call_args.kwargs["model"] is health_check_model
+    mock_prisma.db.litellm_healthchecktable.find_many.assert_not_called()
+
+
 if __name__ == "__main__":
-    pytest.main([__file__]) 
\ No newline at end of file
+    pytest.main([__file__])
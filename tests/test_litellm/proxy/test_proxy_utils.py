@@ -57,3 +57,682 @@ def test_proxy_only_error_false_for_other_error_type():
         )
         is False
     )
+
+
+def test_safe_deep_copy_clones_nested_containers():
+    from litellm.proxy.utils import safe_deep_copy
+
+    otel_span = object()
+    data = {
+        "model": "gpt-4o",
+        "messages": [{"role": "user", "content": "hi"}],
+        "metadata": {"tags": ["a", "b"], "litellm_parent_otel_span": otel_span},
+    }
+
+    new_data = safe_deep_copy(data)
+
+    assert new_data == {
+        "model": "gpt-4o",
+        "messages": [{"role": "user", "content": "hi"}],
+        "metadata": {"tags": ["a", "b"], "litellm_parent_otel_span": otel_span},
+    }
+    assert new_data["messages"] is not data["messages"]
+    assert new_data["messages"][0] is not data["messages"][0]
+    assert new_data["metadata"] is not data["metadata"]
+    assert new_data["metadata"]["tags"] is not data["metadata"]["tags"]
+    assert data["metadata"]["litellm_parent_otel_span"] is otel_span
+    assert new_data["metadata"]["litellm_parent_otel_span"] is otel_span
+
+
+def test_safe_deep_copy_handles_cycles_and_shared_references():
+    from litellm.proxy.utils import safe_deep_copy
+
+    shared = {"content": "hi"}
+    data = {"messages": [shared, shared], "metadata": {}}
+    data["metadata"]["request"] = data
+
+    new_data = safe_deep_copy(data)
+
+    assert new_data["metadata"]["request"] is new_data
+    assert new_data["messages"][0] is new_data["messages"][1]
+    assert new_data["messages"][0] is not shared
+
+
+def test_pre_call_hook_callbacks_rebuilt_when_callbacks_change(monkeypatch):
+    import litellm
+    from litellm.integrations.custom_logger import CustomLogger
+
+    class PreCallLogger(CustomLogger):
+        async def async_pre_call_hook(
+            self, user_api_key_dict, cache, data, call_type
+        ):
+            return data
+
+    no_hook_logger = CustomLogger()
+    pre_call_logger = PreCallLogger()
+    monkeypatch.setattr(litellm, "callbacks", [no_hook_logger])
+
+    proxy_logging_obj = ProxyLogging(user_api_key_cache=DualCache())
+    assert proxy_logging_obj._get_pre_call_hook_callbacks() == []
+
+    litellm.callbacks.append(pre_call_logger)
+    assert proxy_logging_obj._get_pre_call_hook_callbacks() == [pre_call_logger]
+
+    monkeypatch.setattr(litellm, "callbacks", [])
+    assert proxy_logging_obj._get_pre_call_hook_callbacks() == []
+
+
+def test_resolve_callback_caches_string_callbacks():
+    from unittest.mock import patch
+
+    from litellm.integrations.custom_logger import CustomLogger
+
+    proxy_logging_obj = ProxyLogging(user_api_key_cache=DualCache())
+    custom_logger = CustomLogger()
+    with patch(
+        "litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class",
+        return_value=custom_logger,
+    ) as mock_get_class:
+        assert proxy_logging_obj._resolve_callback("langsmith") is custom_logger
+        assert proxy_logging_obj._resolve_callback("langsmith") is custom_logger
+        assert mock_get_class.call_count == 1
+
+    assert proxy_logging_obj._resolve_callback(custom_logger) is custom_logger
+
+
+def test_alert_types_set_tracks_alert_types():
+    from litellm.proxy._types import AlertType
+
+    proxy_logging_obj = ProxyLogging(user_api_key_cache=DualCache())
+    proxy_logging_obj.update_values(alert_types=[AlertType.llm_exceptions])
+    assert proxy_logging_obj._alert_types_set == frozenset([AlertType.llm_exceptions])
+
+    # direct assignment (as done by proxy_server) keeps the set in sync
+    proxy_logging_obj.alert_types = [AlertType.db_exceptions]
+    assert AlertType.db_exceptions in proxy_logging_obj._alert_types_set
+    assert AlertType.llm_exceptions not in proxy_logging_obj._alert_types_set
+    assert proxy_logging_obj.is_alert_type_enabled(AlertType.db_exceptions) is True
+    assert proxy_logging_obj.is_alert_type_enabled(AlertType.llm_exceptions) is False
+
+
+@pytest.mark.asyncio
+async def test_pre_and_during_call_hook_short_circuit_without_hooks(monkeypatch):
+    import litellm
+    from litellm.integrations.custom_logger import CustomLogger
+    from litellm.proxy._types import UserAPIKeyAuth
+
+    monkeypatch.setattr(litellm, "callbacks", [CustomLogger()])
+    proxy_logging_obj = ProxyLogging(user_api_key_cache=DualCache())
+    data = {"model": "gpt-4o"}
+
+    assert (
+        await proxy_logging_obj.pre_call_hook(
+            user_api_key_dict=UserAPIKeyAuth(), data=data, call_type="completion"
+        )
+        is data
+    )
+    assert (
+        await proxy_logging_obj.during_call_hook(
+            data=data, user_api_key_dict=UserAPIKeyAuth(), call_type="completion"
+        )
+        is data
+    )
+    assert proxy_logging_obj._get_during_call_hook_callbacks() == []
+
+
+def test_orjson_dumps_round_trips():
+    from litellm.proxy.utils import _orjson_dumps
+
+    value = {"current_requests": 1, "current_tpm": 10, "current_rpm": 1}
+    assert json.loads(_orjson_dumps(value)) == value
+    assert json.loads(_orjson_dumps("success")) == "success"
+    assert isinstance(_orjson_dumps([{"request_id": "1", "spend": 0.1}]), bytes)
+    # orjson can't encode ints > 64 bits, falls back to json.dumps
+    assert json.loads(_orjson_dumps({"big": 2**70})) == {"big": 2**70}
+    assert isinstance(_orjson_dumps({"big": 2**70}), bytes)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_hook_event_never_drops_alerts_when_full(monkeypatch):
+    import asyncio
+
+    import litellm.proxy.utils as proxy_utils
+
+    monkeypatch.setattr(proxy_utils, "MAX_SIZE_PROXY_HOOK_QUEUE", 2)
+    proxy_logging_obj = ProxyLogging(user_api_key_cache=DualCache())
+    sent = []
+
+    async def mock_alerting_handler(**kwargs):
+        sent.append(kwargs["message"])
+
+    proxy_logging_obj.alerting_handler = mock_alerting_handler
+
+    # enqueue without yielding, so the workers can't drain in between
+    for i in range(4):
+        proxy_logging_obj._enqueue_hook_event(kind="alert", payload={"message": str(i)})
+
+    await asyncio.wait_for(proxy_logging_obj._hook_queue.join(), timeout=1)
+    await asyncio.sleep(0)
+    assert sorted(sent) == ["0", "1", "2", "3"]
+    assert proxy_logging_obj._hook_events_overflowed == 2
+    assert proxy_logging_obj._hook_events_dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_enqueue_hook_event_drops_new_droppable_events_when_full(monkeypatch):
+    import asyncio
+    from unittest.mock import AsyncMock
+
+    import litellm.proxy.utils as proxy_utils
+
+    monkeypatch.setattr(proxy_utils, "MAX_SIZE_PROXY_HOOK_QUEUE", 2)
+    proxy_logging_obj = ProxyLogging(user_api_key_cache=DualCache())
+    proxy_logging_obj.slack_alerting_instance.response_taking_too_long = AsyncMock()
+
+    for i in range(4):
+        proxy_logging_obj._enqueue_hook_event(
+            kind="response_taking_too_long", payload={"request_data": {"id": i}}
+        )
+
+    await asyncio.wait_for(proxy_logging_obj._hook_queue.join(), timeout=1)
+    handled = [
+        call.kwargs["request_data"]["id"]
+        for call in proxy_logging_obj.slack_alerting_instance.response_taking_too_long.call_args_list
+    ]
+    assert sorted(handled) == [0, 1]
+    assert proxy_logging_obj._hook_events_dropped == 2
+
+
+@pytest.mark.asyncio
+async def test_enqueue_hook_event_restarts_dead_workers():
+    import asyncio
+    from unittest.mock import AsyncMock
+
+    proxy_logging_obj = ProxyLogging(user_api_key_cache=DualCache())
+    proxy_logging_obj.alerting_handler = AsyncMock()
+    proxy_logging_obj._enqueue_hook_event(kind="alert", payload={"message": "0"})
+    await asyncio.wait_for(proxy_logging_obj._hook_queue.join(), timeout=1)
+
+    # any worker dying, not just the first, gets replaced on the next enqueue
+    dead_worker = proxy_logging_obj._hook_worker_tasks[-1]
+    dead_worker.cancel()
+    await asyncio.sleep(0)
+    assert dead_worker.done()
+
+    proxy_logging_obj._enqueue_hook_event(kind="alert", payload={"message": "1"})
+    assert all(not task.done() for task in proxy_logging_obj._hook_worker_tasks)
+    assert dead_worker not in proxy_logging_obj._hook_worker_tasks
+    await asyncio.wait_for(proxy_logging_obj._hook_queue.join(), timeout=1)
+    assert proxy_logging_obj.alerting_handler.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_log_db_failure_runs_failure_handler_on_hook_workers():
+    import asyncio
+    from unittest.mock import AsyncMock
+
+    proxy_logging_obj = ProxyLogging(user_api_key_cache=DualCache())
+    proxy_logging_obj.failure_handler = AsyncMock()
+
+    proxy_logging_obj.log_db_failure(
+        original_exception=Exception("db down"), duration=0.1, call_type="get_data"
+    )
+
+    await asyncio.wait_for(proxy_logging_obj._hook_queue.join(), timeout=1)
+    proxy_logging_obj.failure_handler.assert_awaited_once()
+    assert proxy_logging_obj.failure_handler.call_args.kwargs["call_type"] == "get_data"
+
+
+@pytest.mark.asyncio
+async def test_log_db_failure_is_not_dropped_when_queue_full(monkeypatch):
+    import asyncio
+    from unittest.mock import AsyncMock
+
+    import litellm.proxy.utils as proxy_utils
+
+    monkeypatch.setattr(proxy_utils, "MAX_SIZE_PROXY_HOOK_QUEUE", 1)
+    proxy_logging_obj = ProxyLogging(user_api_key_cache=DualCache())
+    proxy_logging_obj.failure_handler = AsyncMock()
+
+    for _ in range(3):
+        proxy_logging_obj.log_db_failure(
+            original_exception=Exception("db down"),
+            duration=0.1,
+            call_type="update_spend",
+        )
+
+    await asyncio.wait_for(proxy_logging_obj._hook_queue.join(), timeout=1)
+    await asyncio.sleep(0)
+    assert proxy_logging_obj.failure_handler.await_count == 3
+    assert proxy_logging_obj._hook_events_dropped == 0
+
+
+@pytest.mark.asyncio
+async def test_post_call_failure_hook_runs_callbacks_on_hook_workers(monkeypatch):
+    import asyncio
+
+    import litellm
+    from litellm.integrations.custom_logger import CustomLogger
+    from litellm.proxy._types import UserAPIKeyAuth
+
+    class FailureLogger(CustomLogger):
+        def __init__(self):
+            self.called = False
+
+        async def async_post_call_failure_hook(self, **kwargs):
+            self.called = True
+
+    failure_logger = FailureLogger()
+    monkeypatch.setattr(litellm, "callbacks", [failure_logger])
+    proxy_logging_obj = ProxyLogging(user_api_key_cache=DualCache())
+
+    await proxy_logging_obj.post_call_failure_hook(
+        request_data={},
+        original_exception=Exception("bad request"),
+        user_api_key_dict=UserAPIKeyAuth(),
+    )
+    await asyncio.wait_for(proxy_logging_obj._hook_queue.join(), timeout=1)
+    assert failure_logger.called is True
+
+
+def test_resolved_callbacks_flag_guardrails(monkeypatch):
+    import litellm
+    from litellm.integrations.custom_guardrail import CustomGuardrail
+    from litellm.integrations.custom_logger import CustomLogger
+
+    custom_logger = CustomLogger()
+    guardrail = CustomGuardrail(guardrail_name="test-guardrail")
+    monkeypatch.setattr(litellm, "callbacks", [custom_logger, guardrail, object()])
+    proxy_logging_obj = ProxyLogging(user_api_key_cache=DualCache())
+
+    resolved_callbacks = proxy_logging_obj._get_resolved_callbacks()
+    assert resolved_callbacks == [(custom_logger, False), (guardrail, True)]
+    # cached until litellm.callbacks changes
+    assert proxy_logging_obj._get_resolved_callbacks() is resolved_callbacks
+
+    litellm.callbacks.append(CustomLogger())
+    assert len(proxy_logging_obj._get_resolved_callbacks()) == 3
+
+
+def test_hook_callbacks_refresh_on_same_length_swap(monkeypatch):
+    import litellm
+    from litellm.integrations.custom_guardrail import CustomGuardrail
+
+    old_guardrail = CustomGuardrail(guardrail_name="old-guardrail")
+    new_guardrail = CustomGuardrail(guardrail_name="new-guardrail")
+    monkeypatch.setattr(litellm, "callbacks", [old_guardrail])
+    proxy_logging_obj = ProxyLogging(user_api_key_cache=DualCache())
+    assert proxy_logging_obj._get_during_call_hook_callbacks() == [old_guardrail]
+
+    # replaced in place - same list, same length
+    litellm.callbacks[0] = new_guardrail
+    assert proxy_logging_obj._get_during_call_hook_callbacks() == [new_guardrail]
+    assert proxy_logging_obj._get_pre_call_hook_callbacks() == [new_guardrail]
+    assert proxy_logging_obj._get_resolved_callbacks() == [(new_guardrail, True)]
+
+
+def test_jsonify_object_dumps_dict_values_without_mutating_input():
+    from litellm.proxy.utils import jsonify_object
+
+    data = {"metadata": {"a": 1}, "models": ["gpt-4o"], "max_budget": 10}
+    db_data = jsonify_object(data)
+
+    assert json.loads(db_data.pop("metadata")) == {"a": 1}
+    assert db_data == {"models": ["gpt-4o"], "max_budget": 10}
+    assert data["metadata"] == {"a": 1}
+    assert jsonify_object({"metadata": {"a": object()}}) == {
+        "metadata": "failed-to-serialize-json"
+    }
+
+
+def test_hash_token_matches_sha256():
+    import hashlib
+
+    from litellm.proxy.utils import hash_token
+
+    token = "sk-1234"
+    expected = hashlib.sha256(token.encode()).hexdigest()
+    assert hash_token(token) == expected
+    # cached path returns the same value
+    assert hash_token(token) == expected
+
+
+def test_cast_expires_to_isoformat():
+    from datetime import datetime
+
+    from litellm.proxy.utils import _cast_expires_to_isoformat
+
+    expires = datetime(2025, 1, 1, 12, 0, 0)
+    row = MagicMock(expires=expires)
+    _cast_expires_to_isoformat(row)
+    assert row.expires == expires.isoformat()
+
+    row = MagicMock(expires=None)
+    _cast_expires_to_isoformat(row)
+    assert row.expires is None
+
+
+@pytest.mark.asyncio
+async def test_post_call_success_hook_raising_logger_stops_later_hooks(monkeypatch):
+    import litellm
+    from litellm.integrations.custom_logger import CustomLogger
+    from litellm.proxy._types import UserAPIKeyAuth
+
+    calls = []
+
+    class FailingLogger(CustomLogger):
+        async def async_post_call_success_hook(self, data, user_api_key_dict, response):
+            calls.append("failing")
+            raise ValueError("rejected")
+
+    class RecordingLogger(CustomLogger):
+        async def async_post_call_success_hook(self, data, user_api_key_dict, response):
+            calls.append("recording")
+
+    monkeypatch.setattr(litellm, "callbacks", [FailingLogger(), RecordingLogger()])
+    proxy_logging_obj = ProxyLogging(user_api_key_cache=DualCache())
+
+    with pytest.raises(ValueError, match="rejected"):
+        await proxy_logging_obj.post_call_success_hook(
+            data={}, response=MagicMock(), user_api_key_dict=UserAPIKeyAuth()
+        )
+    assert calls == ["failing"]
+
+
+@pytest.mark.asyncio
+async def test_post_call_success_hook_mutations_apply_in_callback_order(monkeypatch):
+    import asyncio
+
+    import litellm
+    from litellm.integrations.custom_logger import CustomLogger
+    from litellm.proxy._types import UserAPIKeyAuth
+
+    class AppendingLogger(CustomLogger):
+        def __init__(self, name, delay):
+            super().__init__()
+            self.name = name
+            self.delay = delay
+
+        async def async_post_call_success_hook(self, data, user_api_key_dict, response):
+            await asyncio.sleep(self.delay)
+            data["seen_by"].append(self.name)
+
+    # the slower first hook still runs to completion before the second starts
+    monkeypatch.setattr(
+        litellm,
+        "callbacks",
+        [AppendingLogger("first", 0.01), AppendingLogger("second", 0)],
+    )
+    proxy_logging_obj = ProxyLogging(user_api_key_cache=DualCache())
+
+    data: dict = {"seen_by": []}
+    await proxy_logging_obj.post_call_success_hook(
+        data=data, response=MagicMock(), user_api_key_dict=UserAPIKeyAuth()
+    )
+    assert data["seen_by"] == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_post_call_success_hook_raising_guardrail_stops_later_hooks(monkeypatch):
+    import litellm
+    from litellm.integrations.custom_guardrail import CustomGuardrail
+    from litellm.integrations.custom_logger import CustomLogger
+    from litellm.proxy._types import UserAPIKeyAuth
+    from litellm.types.guardrails import GuardrailEventHooks
+
+    calls = []
+
+    class RecordingLogger(CustomLogger):
+        def __init__(self, name):
+            super().__init__()
+            self.name = name
+
+        async def async_post_call_success_hook(self, data, user_api_key_dict, response):
+            calls.append(self.name)
+
+    class BlockingGuardrail(CustomGuardrail):
+        async def async_post_call_success_hook(self, data, user_api_key_dict, response):
+            calls.append("guardrail")
+            raise ValueError("blocked")
+
+    guardrail = BlockingGuardrail(
+        guardrail_name="blocking",
+        event_hook=GuardrailEventHooks.post_call,
+        default_on=True,
+    )
+    monkeypatch.setattr(
+        litellm,
+        "callbacks",
+        [RecordingLogger("before"), guardrail, RecordingLogger("after")],
+    )
+    proxy_logging_obj = ProxyLogging(user_api_key_cache=DualCache())
+
+    with pytest.raises(ValueError, match="blocked"):
+        await proxy_logging_obj.post_call_success_hook(
+            data={}, response=MagicMock(), user_api_key_dict=UserAPIKeyAuth()
+        )
+    assert calls == ["before", "guardrail"]
+
+
+def test_hash_tokens_if_needed_only_hashes_plain_text_keys():
+    from litellm.proxy.utils import _hash_tokens_if_needed, hash_token
+
+    hashed_token = hash_token("sk-abc")
+    assert _hash_tokens_if_needed(["sk-abc", hashed_token, "sk-def"]) == [
+        hashed_token,
+        hashed_token,
+        hash_token("sk-def"),
+    ]
+
+
+def test_build_token_view_does_not_share_state_between_calls():
+    from litellm.proxy.utils import _build_token_view
+
+    def make_row() -> dict:
+        return {
+            "token": "hashed-token",
+            "spend": 1.0,
+            "user_id": "user-1",
+            "metadata": {"tags": ["a"]},
+            "team_models": None,
+            "team_blocked": None,
+            "team_members_with_roles": [{"role": "admin", "user_id": "user-1"}],
+        }
+
+    first_view = _build_token_view(make_row())
+    first_view.metadata["tags"].append("mutated")
+    second_view = _build_token_view(make_row())
+
+    assert second_view.metadata == {"tags": ["a"]}
+    assert second_view.team_member is not None
+    assert second_view.team_member.role == "admin"
+    assert second_view.team_models == []
+    assert second_view.team_blocked is False
+
+
+def test_build_token_view_reads_team_members_from_each_row():
+    from litellm.proxy.utils import _build_token_view
+
+    def make_row(members_with_roles: list) -> dict:
+        return {
+            "token": "hashed-token",
+            "user_id": "user-1",
+            "team_id": "team-1",
+            "team_models": None,
+            "team_blocked": None,
+            "team_members_with_roles": members_with_roles,
+        }
+
+    view = _build_token_view(make_row([{"role": "admin", "user_id": "user-1"}]))
+    assert view.team_member is not None and view.team_member.role == "admin"
+
+    # membership changed (e.g. via raw SQL) without any other team row change
+    view = _build_token_view(make_row([{"role": "user", "user_id": "user-1"}]))
+    assert view.team_member is not None and view.team_member.role == "user"
+
+    view = _build_token_view(make_row([{"role": "admin", "user_id": "user-2"}]))
+    assert view.team_member is None
+
+
+def test_jsonify_object_dumps_requested_list_keys():
+    from litellm.proxy.utils import jsonify_object
+
+    members = [{"role": "admin", "user_id": "user-1"}]
+    db_data = jsonify_object(
+        {"members_with_roles": members, "models": ["gpt-4o"]},
+        json_list_keys=("members_with_roles",),
+    )
+    assert json.loads(db_data["members_with_roles"]) == members
+    assert db_data["models"] == ["gpt-4o"]
+
+
+@pytest.mark.asyncio
+async def test_send_email_runs_smtp_off_the_event_loop(monkeypatch):
+    import threading
+    from unittest.mock import patch
+
+    from litellm.proxy.utils import send_email
+
+    monkeypatch.setenv("SMTP_HOST", "smtp.example.com")
+    monkeypatch.setenv("SMTP_SENDER_EMAIL", "sender@example.com")
+    monkeypatch.setenv("SMTP_TLS", "False")
+    loop_thread = threading.get_ident()
+    smtp_threads = []
+
+    def mock_smtp(**kwargs):
+        smtp_threads.append(threading.get_ident())
+        return MagicMock()
+
+    with patch("litellm.proxy.utils.smtplib.SMTP", side_effect=mock_smtp):
+        await send_email(
+            receiver_email="receiver@example.com", subject="hi", html="<p>hi</p>"
+        )
+
+    assert len(smtp_threads) == 1
+    assert smtp_threads[0] != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_cache_user_row_caches_json_safe_dict():
+    from datetime import datetime
+    from unittest.mock import AsyncMock
+
+    from litellm.proxy._types import LiteLLM_UserTable
+    from litellm.proxy.utils import _cache_user_row
+
+    cache = DualCache()
+    db = MagicMock()
+    db.get_data = AsyncMock(
+        return_value=LiteLLM_UserTable(
+            user_id="user-1", max_budget=10.0, spend=1.0, created_at=datetime.now()
+        )
+    )
+
+    await _cache_user_row(user_id="user-1", cache=cache, db=db)
+    await _cache_user_row(user_id="user-1", cache=cache, db=db)
+
+    cached_row = await cache.async_get_cache(key="user-1_user_api_key_user_id")
+    assert cached_row["max_budget"] == 10.0
+    assert isinstance(cached_row["created_at"], str)
+    db.get_data.assert_called_once()
+
+
+def test_month_bounds_handles_december():
+    from datetime import date
+
+    from litellm.proxy.utils import _month_bounds
+
+    assert _month_bounds(date(2024, 12, 20)) == (20, 11)
+    assert _month_bounds(date(2024, 2, 1)) == (1, 28)
+
+
+def test_is_known_model_sees_model_group_alias_changes():
+    from litellm import Router
+    from litellm.proxy.utils import is_known_model
+
+    llm_router = Router(
+        model_list=[
+            {"model_name": "gpt-4", "litellm_params": {"model": "gpt-4"}},
+        ]
+    )
+    assert is_known_model("gpt-4", llm_router) is True
+    assert is_known_model("gpt-4-alias", llm_router) is False
+
+    llm_router.model_group_alias = {"gpt-4-alias": "gpt-4"}
+    assert is_known_model("gpt-4-alias", llm_router) is True
+
+    llm_router.model_list.clear()
+    assert is_known_model("gpt-4", llm_router) is False
+
+
+@pytest.mark.asyncio
+async def test_get_data_user_list_keeps_key_aliases_an_array():
+    import inspect
+    from unittest.mock import AsyncMock
+
+    from litellm.proxy.utils import PrismaClient
+
+    client = MagicMock()
+    client.db.query_raw = AsyncMock(return_value=[])
+
+    await inspect.unwrap(PrismaClient.get_data)(
+        client, table_name="user", query_type="find_all", limit=10, offset=20
+    )
+
+    sql_query, limit, offset = client.db.query_raw.call_args[0]
+    assert "COALESCE" in sql_query and "'[]'::json" in sql_query
+    assert (limit, offset) == (10, 20)
+
+
+@pytest.mark.asyncio
+async def test_internal_usage_cache_local_only_goes_through_dual_cache():
+    from unittest.mock import AsyncMock
+
+    from litellm.proxy.utils import InternalUsageCache
+
+    dual_cache = MagicMock()
+    dual_cache.async_get_cache = AsyncMock(return_value="value")
+    dual_cache.async_set_cache = AsyncMock()
+    internal_usage_cache = InternalUsageCache(dual_cache=dual_cache)
+
+    await internal_usage_cache.async_set_cache(
+        key="k", value="value", litellm_parent_otel_span=None, local_only=True
+    )
+    assert (
+        await internal_usage_cache.async_get_cache(
+            key="k", litellm_parent_otel_span=None, local_only=True
+        )
+        == "value"
+    )
+    assert dual_cache.async_set_cache.call_args.kwargs["local_only"] is True
+    assert dual_cache.async_get_cache.call_args.kwargs["local_only"] is True
+    dual_cache.in_memory_cache.get_cache.assert_not_called()
+    dual_cache.in_memory_cache.set_cache.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "include_budget,expected_include",
+    [(True, {"litellm_budget_table": True}), (False, None)],
+)
+async def test_get_data_key_lookup_include_budget(include_budget, expected_include):
+    import inspect
+    from unittest.mock import AsyncMock
+
+    from litellm.proxy.utils import PrismaClient
+
+    client = MagicMock()
+    client.db.litellm_verificationtoken.find_unique = AsyncMock(
+        return_value=MagicMock(expires=None)
+    )
+
+    await inspect.unwrap(PrismaClient.get_data)(
+        client,
+        token="sk-1234",
+        table_name="key",
+        query_type="find_unique",
+        include_budget=include_budget,
+    )
+
+    call_kwargs = client.db.litellm_verificationtoken.find_unique.call_args.kwargs
+    assert call_kwargs["include"] == expected_include
@@ -2183,6 +2183,12 @@ def test_is_valid_api_key():
     # Invalid: wrong length for hash
     assert not is_valid_api_key("a" * 63)
     assert not is_valid_api_key("a" * 65)
+    # Invalid: trailing newline
+    assert not is_valid_api_key("sk-abc123\n")
+    assert not is_valid_api_key("a" * 64 + "\n")
+    # Invalid: whitespace or non-hex chars in a 64 char key
+    assert not is_valid_api_key("ab " + "a" * 61)
+    assert not is_valid_api_key("g" * 64)
 
 
 if __name__ == "__main__":